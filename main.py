@@ -1,4 +1,4 @@
-from mods.llm import AIRouter
+from mods.llm import AIRouter, close_http_clients
 from mods.config import ProfileManager, SettingsManager
 from mods.utils.logging_config import LoggingConfig
 from pathlib import Path
@@ -148,4 +148,6 @@ except KeyboardInterrupt:
     print("🛑 Shutting down...")
 except Exception as e:
     print(f"❌ Error running {platform_type} platform: {e}")
-    exit(1)
\ No newline at end of file
+    exit(1)
+finally:
+    close_http_clients()
@@ -1,7 +1,7 @@
 from mods.objects.messages import Message
 from mods.objects.person import Person
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from typing import List, Optional, Tuple, Dict, Any
 from datetime import datetime, timedelta, timezone
 from typing import TYPE_CHECKING, Optional
@@ -44,6 +44,17 @@ class Decision:
 
         self._log_participation_settings()
 
+    def _get_shared_prompt_prefix(self) -> List[BaseMessage]:
+        """
+        Get the leading messages shared by the reply, intention and tool detection prompts.
+
+        Keeping the (large) profile block as an identical first message lets providers with
+        prompt prefix caching reuse it across the decision calls made for each message.
+        """
+        if not self.profile:
+            return []
+        return [SystemMessage(content=f"## AI PROFILE CONTEXT\n{self.profile.format_for_llm(include_metadata=False)}")]
+
     def _get_cache_ttl_settings(self) -> Dict[str, int]:
         """Get cache TTL settings from settings manager or use defaults."""
         if self.settings_manager:
@@ -1230,20 +1241,11 @@ Consider if the answer is relevant and responsive to the question.
         ) -> str:
             """Construct a professional-grade decision prompt using expert AI engineering principles."""
             
-            profile_context = ""
-            if self.profile:
-                profile_context = f"""
-{self.profile.format_for_llm(include_metadata=False)}
-
-"""
-            
             system_role = f"""# AI CONVERSATION PARTICIPATION DECISION SYSTEM
 
 ## YOUR ROLE
 You are a **Conversation Analysis Expert** tasked with making intelligent decisions about AI participation in chat conversations. Your expertise lies in understanding conversation dynamics, social context, optimal intervention points, and profile-content matching.
 
-{profile_context}
-
 ## CORE MISSION
 Determine whether an AI assistant should respond to a specific message by analyzing conversational context, participant dynamics, potential value addition, and personality profile compatibility.
 
@@ -1444,7 +1446,7 @@ Determine whether an AI assistant should respond to a specific message by analyz
                 target_message
             )
             
-            messages = [
+            messages = self._get_shared_prompt_prefix() + [
                 SystemMessage(content="You are an expert conversation analyst specializing in AI participation decisions. Apply rigorous analytical thinking and provide structured reasoning for your decisions."),
                 HumanMessage(content=prompt_content),
             ]
@@ -1512,20 +1514,11 @@ Determine whether an AI assistant should respond to a specific message by analyz
         ) -> str:
             """Construct a focused prompt for intention detection."""
             
-            profile_context = ""
-            if self.profile:
-                profile_context = f"""
-## AI PROFILE CONTEXT
-{self.profile.format_for_llm(include_metadata=False)}
-"""
-            
             system_role = f"""# MESSAGE INTENTION CLASSIFICATION SYSTEM
 
 ## YOUR ROLE
 You are a **Message Intent Classifier** specialized in determining the complexity level of messages to optimize AI response generation and token usage.
 
-{profile_context}
-
 ## CLASSIFICATION MISSION
 Classify the target message as either 'basic' or 'complex' based on the response complexity required.
 """
@@ -1808,7 +1801,7 @@ REASONING: [Brief explanation]"""
                 extra_context
             )
 
-            messages = [
+            messages = self._get_shared_prompt_prefix() + [
                 SystemMessage(content="You are an expert message intent classifier. Analyze messages efficiently to determine if they need basic or complex response processing."),
                 HumanMessage(content=prompt_content),
             ]
@@ -1874,13 +1867,6 @@ REASONING: [Brief explanation]"""
         ) -> str:
             """Construct a specialized prompt for tool requirement detection."""
             
-            profile_context = ""
-            if self.profile:
-                profile_context = f"""
-## AI PROFILE CONTEXT
-{self.profile.format_for_llm(include_metadata=False)}
-"""
-            
             from mods.agent.tools.tool import tool_manager
             available_tools = tool_manager.get_available_tools_for_prompt()
             
@@ -1889,8 +1875,6 @@ REASONING: [Brief explanation]"""
 ## YOUR ROLE
 You are a **Tool Requirement Analyst** specialized in determining what external information gathering tools are needed to properly respond to user messages.
 
-{profile_context}
-
 ## MISSION
 Analyze the user's message and determine if external tools are needed to provide accurate, helpful information. Return specific tool calls in JSON format.
 """
@@ -2096,7 +2080,7 @@ Based on the message analysis:
                 extra_context
             )
 
-            messages = [
+            messages = self._get_shared_prompt_prefix() + [
                 SystemMessage(content="You are an expert tool requirement analyst. Determine what external tools are needed to properly respond to user messages and return specific tool calls in JSON format."),
                 HumanMessage(content=prompt_content),
             ]
@@ -113,7 +113,16 @@ class SettingsManager:
                     "min_delay_seconds": 0.5,
                     "max_delay_seconds": 15.0,
                     "thinking_threshold_chars": 100,
-                    "reading_threshold_chars": 50
+                    "reading_threshold_chars": 50,
+                    "min_show_chars": 20
+                },
+                "speculative_generation": {
+                    "enabled": False
+                },
+                "streaming_responses": {
+                    "enabled": False,
+                    "initial_chunk_chars": 40,
+                    "edit_interval_seconds": 1.0
                 },
                 "context_engine": {
                     "max_context_messages": 10,
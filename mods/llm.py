@@ -1,8 +1,12 @@
 from typing import Dict, Tuple, Any, Optional
 from langchain_core.language_models.chat_models import BaseChatModel
+import asyncio
+import importlib.util
 import logging
 import os
 
+import httpx
+
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
 from langchain_groq import ChatGroq
@@ -24,6 +28,46 @@ INIT_PROVIDERS: Dict[str, Dict[Tuple[str, str, str], BaseChatModel]] = {
     "google"  : {},
 }
 
+"""
+Shared HTTP connection pools handed to providers whose SDKs accept an external
+httpx client, so every model instance reuses the same keep-alive connections
+instead of paying a fresh TLS handshake. HTTP/2 is only enabled when the
+optional `h2` package is installed.
+"""
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+HTTP_TIMEOUT = 60.0
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+SHARED_HTTP_CLIENT = httpx.Client(http2=_HTTP2_AVAILABLE, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+SHARED_ASYNC_HTTP_CLIENT = httpx.AsyncClient(http2=_HTTP2_AVAILABLE, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS)
+
+async def aclose_http_clients():
+    """
+    Closes the shared async HTTP connection pool on the running event loop.
+
+    Platforms await this when their client stops, while the loop that opened the pooled
+    connections is still running, so the connections can be closed gracefully.
+    """
+    await SHARED_ASYNC_HTTP_CLIENT.aclose()
+
+def close_http_clients():
+    """
+    Closes the shared HTTP connection pools.
+
+    The pools are shared by every platform and model instance, so this must only be
+    called once, at application shutdown after the platform's event loop has finished.
+    The async pool is normally already closed by the platform through `aclose_http_clients`.
+    """
+    SHARED_HTTP_CLIENT.close()
+    if SHARED_ASYNC_HTTP_CLIENT.is_closed:
+        return
+    try:
+        # Last resort: the platform exited without closing the async pool on its own loop
+        asyncio.run(SHARED_ASYNC_HTTP_CLIENT.aclose())
+    except Exception as e:
+        # Connections opened on the platform's (now closed) event loop cannot be closed gracefully
+        logging.getLogger(__name__).debug(f"Could not close async HTTP client cleanly: {e}")
+
 def get_provider_from_cache(provider_name: str, key: Tuple[str, str, str]) -> Optional[BaseChatModel]:
     """
     Retrieves a provider instance from the cache if it exists.
@@ -128,6 +172,8 @@ class AIRouter:
                         api_key=api_key,
                         base_url=azure_endpoint,
                         api_version=api_version,
+                        http_client=kwargs.pop("http_client", SHARED_HTTP_CLIENT),
+                        http_async_client=kwargs.pop("http_async_client", SHARED_ASYNC_HTTP_CLIENT),
                         **kwargs
                     )
                 else:
@@ -135,6 +181,8 @@ class AIRouter:
                     provider = ChatOpenAI(
                         model=model,
                         api_key=api_key,
+                        http_client=kwargs.pop("http_client", SHARED_HTTP_CLIENT),
+                        http_async_client=kwargs.pop("http_async_client", SHARED_ASYNC_HTTP_CLIENT),
                         **kwargs
                     )
             elif provider_name in ("claude", "anthropic"):
@@ -147,6 +195,8 @@ class AIRouter:
                 provider = ChatGroq(
                     model=model,
                     api_key=api_key,
+                    http_client=kwargs.pop("http_client", SHARED_HTTP_CLIENT),
+                    http_async_client=kwargs.pop("http_async_client", SHARED_ASYNC_HTTP_CLIENT),
                     **kwargs
                 )
             elif provider_name == "ollama":
@@ -174,4 +224,4 @@ class AIRouter:
                 error=str(e)
             )
 
-__all__ = ["AIRouter", "AIProviderError"]
\ No newline at end of file
+__all__ = ["AIRouter", "AIProviderError", "aclose_http_clients", "close_http_clients"]
\ No newline at end of file
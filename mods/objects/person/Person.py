@@ -6,10 +6,16 @@ This class will be used to store the person's information
 from typing import List, Dict, Any, Optional
 import uuid
 
+AI_IDENTIFIER = "ai_assistant"
+
 class Person:
+    __slots__ = ('person_id', 'identifiers', 'metadata', '_is_ai', '_display_name')
+    
     person_id   : str
     identifiers : list[str]
     metadata    : Dict[str, Any]
+    _is_ai      : bool
+    _display_name : str
     
     def __init__(
         self,
@@ -20,6 +26,8 @@ class Person:
         self.person_id   = person_id
         self.identifiers = identifiers
         self.metadata    = metadata if metadata is not None else {}
+        self._is_ai      = AI_IDENTIFIER in identifiers
+        self._display_name = self._compute_display_name()
     
     """
     User identifier methods
@@ -29,8 +37,14 @@ class Person:
     3. Get an identifier
     4. Get all identifiers
     """
-    def add_identifier(self, identifier: str)   : self.identifiers.append(identifier)
-    def remove_identifier(self, identifier: str) : self.identifiers.remove(identifier)
+    def add_identifier(self, identifier: str):
+        self.identifiers.append(identifier)
+        if identifier == AI_IDENTIFIER: self._is_ai = True
+        if self._display_name == self.person_id: self._display_name = self._compute_display_name()
+    def remove_identifier(self, identifier: str):
+        self.identifiers.remove(identifier)
+        if identifier == AI_IDENTIFIER: self._is_ai = AI_IDENTIFIER in self.identifiers
+        if identifier == self._display_name: self._display_name = self._compute_display_name()
     def get_identifier(self, identifier: str) -> Optional[str]:
         if identifier in self.identifiers:
             return identifier
@@ -39,6 +53,10 @@ class Person:
         if limit is None or limit < 0: return self.identifiers
         return self.identifiers[:limit]
     
+    def _compute_display_name(self) -> str:
+        # The first non-numeric identifier is usually the username; fall back to person_id
+        return next((i for i in self.identifiers if not i.isdigit()), self.person_id)
+    
     """
     User message methods
     
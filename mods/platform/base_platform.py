@@ -232,6 +232,66 @@ class BasePlatform(ABC):
         """
         pass
 
+    # Optional capabilities that platforms may override
+
+    def supports_message_edits(self) -> bool:
+        """
+        Check if this platform can edit messages it has already sent.
+
+        Returns:
+            bool: True if `send_editable_message` and `edit_message` are implemented.
+        """
+        return False
+
+    async def send_editable_message(self, chat_id: str, content: str) -> Optional[str]:
+        """
+        Send a message that can later be updated with `edit_message`.
+
+        Args:
+            chat_id (str): The platform-specific chat/channel ID.
+            content (str): The message content to send.
+
+        Returns:
+            Optional[str]: The platform-specific ID of the sent message, or None on failure.
+        """
+        return None
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> bool:
+        """
+        Replace the content of a previously sent message.
+
+        Args:
+            chat_id (str): The platform-specific chat/channel ID.
+            message_id (str): The ID returned by `send_editable_message`.
+            content (str): The new message content.
+
+        Returns:
+            bool: True if the message was edited successfully, False otherwise.
+        """
+        return False
+
+    async def delete_message(self, chat_id: str, message_id: str) -> bool:
+        """
+        Delete a message previously sent with `send_editable_message`.
+
+        Args:
+            chat_id (str): The platform-specific chat/channel ID.
+            message_id (str): The ID returned by `send_editable_message`.
+
+        Returns:
+            bool: True if the message was deleted successfully, False otherwise.
+        """
+        return False
+
+    def get_max_message_length(self) -> Optional[int]:
+        """
+        Get the maximum number of characters a single message may contain.
+
+        Returns:
+            Optional[int]: The platform's message length limit, or None if it has no known limit.
+        """
+        return None
+
     # Shared methods that all platforms can use
 
     def add_flagged_message(self, message_id: str, chat_id: str, flagged_line: str):
@@ -4,6 +4,7 @@ from typing import Any, List, Optional, TYPE_CHECKING
 import discord
 from langchain_core.language_models.chat_models import BaseChatModel
 
+from mods.llm import aclose_http_clients
 from mods.platform.base_platform import BasePlatform, ActiveChat
 from mods.platform.platform_manager import PlatformManager
 from mods.objects.chats.Chat import Chat
@@ -95,6 +96,56 @@ class DiscordPlatform(BasePlatform):
             self.logger.error(f"Error sending Discord message: {e}")
             return False
 
+    def supports_message_edits(self) -> bool:
+        """Discord allows editing our own messages."""
+        return True
+
+    async def send_editable_message(self, chat_id: str, content: str) -> Optional[str]:
+        """Send a message to a Discord channel and return its ID for later edits."""
+        try:
+            channel = self.discord_client.get_channel(int(chat_id))
+            if channel:
+                sent_message = await channel.send(content)
+                return str(sent_message.id)
+            else:
+                self.logger.error(f"Discord channel {chat_id} not found")
+                return None
+        except Exception as e:
+            self.logger.error(f"Error sending Discord message: {e}")
+            return None
+
+    async def edit_message(self, chat_id: str, message_id: str, content: str) -> bool:
+        """Edit one of our previously sent messages in a Discord channel."""
+        try:
+            channel = self.discord_client.get_channel(int(chat_id))
+            if channel:
+                await channel.get_partial_message(int(message_id)).edit(content=content)
+                return True
+            else:
+                self.logger.error(f"Discord channel {chat_id} not found")
+                return False
+        except Exception as e:
+            self.logger.error(f"Error editing Discord message {message_id}: {e}")
+            return False
+
+    async def delete_message(self, chat_id: str, message_id: str) -> bool:
+        """Delete one of our previously sent messages in a Discord channel."""
+        try:
+            channel = self.discord_client.get_channel(int(chat_id))
+            if channel:
+                await channel.get_partial_message(int(message_id)).delete()
+                return True
+            else:
+                self.logger.error(f"Discord channel {chat_id} not found")
+                return False
+        except Exception as e:
+            self.logger.error(f"Error deleting Discord message {message_id}: {e}")
+            return False
+
+    def get_max_message_length(self) -> Optional[int]:
+        """Discord rejects messages longer than 2000 characters."""
+        return 2000
+
     async def start_typing(self, chat_id: str) -> None:
         """Start typing indicator in a Discord channel."""
         try:
@@ -259,6 +310,9 @@ class DiscordPlatform(BasePlatform):
         except Exception as e:
             self.logger.error(f"Error starting Discord platform: {e}")
             raise
+        finally:
+            # Close the shared async HTTP pool while this event loop is still running
+            await aclose_http_clients()
 
     def is_running(self) -> bool:
         """Check if the Discord client is currently running and connected."""
@@ -446,7 +500,7 @@ class DiscordPlatform(BasePlatform):
 
         for identifier in new_identifiers:
             if identifier not in current_identifiers:
-                person.identifiers.append(identifier)
+                person.add_identifier(identifier)
 
     def get_or_create_chat(self, discord_channel: discord.TextChannel) -> Chat:
         """
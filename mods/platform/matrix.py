@@ -32,6 +32,7 @@ from nio import (
 )
 from langchain_core.language_models.chat_models import BaseChatModel
 
+from mods.llm import aclose_http_clients
 from mods.platform.base_platform import BasePlatform, ActiveChat
 from mods.platform.platform_manager import PlatformManager
 from mods.objects.chats.Chat import Chat
@@ -261,7 +262,7 @@ class MatrixPlatform(BasePlatform):
             new_identifiers.append(matrix_user.display_name)
         for identifier in new_identifiers:
             if identifier not in current_identifiers:
-                person.identifiers.append(identifier)
+                person.add_identifier(identifier)
 
     async def _get_matrix_user(self, user_id: str, room: MatrixRoom):
         """Get user information from Matrix."""
@@ -632,6 +633,9 @@ class MatrixPlatform(BasePlatform):
         except Exception as e:
             self.logger.error(f"Error starting Matrix platform: {e}")
             raise
+        finally:
+            # Close the shared async HTTP pool while this event loop is still running
+            await aclose_http_clients()
 
     def is_running(self) -> bool:
         """Check if the Matrix client is currently running and connected."""
@@ -7,6 +7,7 @@ using platform-agnostic Message, Person, and Chat objects.
 """
 
 import asyncio
+from collections import Counter
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 from langchain_core.language_models.chat_models import BaseChatModel
 
@@ -15,13 +16,21 @@ from mods.agent.response_generator import ResponseGenerator
 from mods.objects.messages.Message import Message
 from mods.objects.person.Person import Person
 from mods.utils.logging_config import LoggingConfig
-from mods.utils.message_utils import format_message_content_with_truncation, get_sender_display_name, is_ai_message
+from mods.utils.message_utils import (
+    format_indented_truncated,
+    format_message_content_with_truncation,
+    get_sender_display_name,
+    is_ai_message,
+)
 
 if TYPE_CHECKING:
     from mods.config import Profile, SettingsManager
     from mods.agent.tools.tool import ToolCall
     from mods.platform.base_platform import BasePlatform
 
+# Sent when response generation fails after the decision to reply
+FALLBACK_RESPONSE = "I'm having trouble generating a response right now. Please try again!"
+
 
 class PlatformManager:
     """
@@ -74,28 +83,47 @@ class PlatformManager:
         try:
             sender = message.sender
             chat_id = message.chat.chat_id
+            platform_name = platform.get_platform_name()
 
             sender_type = "AI" if is_ai_message(message) else "USER"
             sender_display = get_sender_display_name(message, include_ai_indicator=True)
             self.logger.debug(
-                f"🔄 Processing {sender_type} message from {sender_display} [{sender.person_id}][{sender.identifiers}] in chat {chat_id} on {platform.get_platform_name()}..."
+                f"🔄 Processing {sender_type} message from {sender_display} [{sender.person_id}][{sender.identifiers}] in chat {chat_id} on {platform_name}..."
             )
 
+            # Optionally start the reply analysis while the reply decision is still being made.
+            # Cancelling the task does not stop its worker thread: discarded analyses still finish
+            # their (billed) LLM calls, see ai_behavior.speculative_generation in settings/README.md
+            speculative_analysis = None
+            if self.settings_manager and self.settings_manager.get('ai_behavior.speculative_generation.enabled', False):
+                speculative_analysis = asyncio.create_task(
+                    asyncio.to_thread(self._analyze_reply_requirements, message, context_messages)
+                )
+
             # Use AI to make reply decision
-            (
-                should_reply,
-                reasoning,
-                is_flagged,
-                flagged_line,
-            ) = self.decision.should_reply(
+            decision_kwargs = dict(
                 target_message=message,
                 context_messages=context_messages,
                 person=sender,
                 is_dm_override=is_dm_override,
             )
+            try:
+                if speculative_analysis is not None:
+                    decision_result = await asyncio.to_thread(self.decision.should_reply, **decision_kwargs)
+                else:
+                    decision_result = self.decision.should_reply(**decision_kwargs)
+            except BaseException:
+                if speculative_analysis is not None:
+                    speculative_analysis.cancel()
+                raise
+            should_reply, reasoning, is_flagged, flagged_line = decision_result
+
+            # Discard the speculative analysis when it will not be used (its LLM calls still complete)
+            if speculative_analysis is not None and (is_flagged or not should_reply):
+                speculative_analysis.cancel()
+                speculative_analysis = None
 
-            formatted_reasoning = format_message_content_with_truncation(reasoning, 500, False)
-            formatted_reasoning = formatted_reasoning.replace("\n", "\n     ")
+            formatted_reasoning = format_indented_truncated(reasoning, 500)
 
             # Handle flagged content
             if is_flagged:
@@ -106,11 +134,12 @@ class PlatformManager:
             # Handle normal reply logic
             if should_reply:
                 return await self._handle_reply(
-                    platform, message, context_messages, formatted_reasoning
+                    platform, platform_name, message, context_messages, formatted_reasoning,
+                    speculative_analysis=speculative_analysis
                 )
             else:
                 return await self._handle_no_reply(
-                    platform, message, formatted_reasoning
+                    platform_name, message, formatted_reasoning
                 )
 
         except Exception as e:
@@ -185,9 +214,11 @@ class PlatformManager:
     async def _handle_reply(
         self,
         platform: "BasePlatform",
+        platform_name: str,
         message: Message,
         context_messages: List[Message],
-        reasoning: str
+        reasoning: str,
+        speculative_analysis: Optional["asyncio.Task"] = None
     ) -> bool:
         """Handle normal reply generation and sending."""
         sender = message.sender
@@ -202,28 +233,20 @@ class PlatformManager:
         self.logger.debug(f"   📝 Message: {formatted_message}")
         self.logger.debug(f"   🤔 Reasoning: {reasoning}")
 
-        # Detect intention
-        intent, intent_reasoning = self.decision.detect_intention(
-            target_message=message,
-            person=sender,
-            context_messages=context_messages,
-        )
+        # Detect intention and required tools, unless already started speculatively
+        if speculative_analysis is not None:
+            (intent, intent_reasoning), (required_tools, tool_reasoning) = await speculative_analysis
+        else:
+            (intent, intent_reasoning), (required_tools, tool_reasoning) = self._analyze_reply_requirements(
+                message, context_messages
+            )
 
-        formatted_intent_reasoning = format_message_content_with_truncation(intent_reasoning, 300, False)
-        formatted_intent_reasoning = formatted_intent_reasoning.replace("\n", "\n     ")
+        formatted_intent_reasoning = format_indented_truncated(intent_reasoning, 300)
 
         self.logger.debug(f"   🎯 Intent: <intent>{intent}</intent>")
         self.logger.debug(f"   💭 Intent Reasoning: {formatted_intent_reasoning}")
 
-        # Detect required tools
-        required_tools, tool_reasoning = self.decision.detect_required_tools(
-            target_message=message,
-            person=sender,
-            context_messages=context_messages,
-        )
-
-        formatted_tool_reasoning = format_message_content_with_truncation(tool_reasoning, 300, False)
-        formatted_tool_reasoning = formatted_tool_reasoning.replace("\n", "\n     ")
+        formatted_tool_reasoning = format_indented_truncated(tool_reasoning, 300)
 
         self.logger.debug(f"   🔧 Required Tools: {len(required_tools)} tool(s)")
         if required_tools:
@@ -245,7 +268,7 @@ class PlatformManager:
                     self.logger.debug(f"     ❌ {tool_name}: {result.get('error', 'Unknown error')}")
 
         # Handle memory operations
-        await self._handle_memory_operations(message, sender, platform.get_platform_name())
+        await self._handle_memory_operations(message, sender, platform_name)
 
         # Generate and send response
         try:
@@ -253,26 +276,38 @@ class PlatformManager:
 
             # Get relevant memories for response generation
             relevant_memories, retrieval_reasoning = self.decision.retrieve_relevant_memories(
-                target_message=message, person=sender, platform_prefix=platform.get_platform_name()
+                target_message=message, person=sender, platform_prefix=platform_name
             )
 
-            generated_response, security_breach = await self.response_generator.generate_response(
-                target_message=message,
-                person=sender,
-                intent=intent,
-                context_messages=context_messages,
-                tool_results=tool_results if tool_results else None,
-                relevant_memories=relevant_memories if relevant_memories else None,
-                extra_context=None,
-            )
+            if self._should_stream_response(platform):
+                generated_response, security_breach, success = await self._stream_response_with_edits(
+                    platform=platform,
+                    message=message,
+                    intent=intent,
+                    context_messages=context_messages,
+                    tool_results=tool_results if tool_results else None,
+                    relevant_memories=relevant_memories if relevant_memories else None,
+                )
+            else:
+                generated_response, security_breach = await self.response_generator.generate_response(
+                    target_message=message,
+                    person=sender,
+                    intent=intent,
+                    context_messages=context_messages,
+                    tool_results=tool_results if tool_results else None,
+                    relevant_memories=relevant_memories if relevant_memories else None,
+                    extra_context=None,
+                )
+                success = False
+                if generated_response:
+                    success = await self._send_response_with_typing(
+                        platform, chat_id, generated_response
+                    )
 
             if security_breach:
                 self.logger.debug("   ⚠️ Security breach detected and handled safely")
 
             if generated_response:
-                success = await self._send_response_with_typing(
-                    platform, chat_id, generated_response
-                )
                 if success:
                     formatted_response = format_message_content_with_truncation(generated_response, 150, True)
                     self.logger.debug(f"   💬 Response Sent: {formatted_response}")
@@ -284,8 +319,7 @@ class PlatformManager:
             self.logger.error(f"   ❌ Error generating response: {e}")
             # Try to send fallback response
             try:
-                fallback_response = "I'm having trouble generating a response right now. Please try again!"
-                await platform.send_message(chat_id, fallback_response)
+                await platform.send_message(chat_id, FALLBACK_RESPONSE)
                 self.logger.debug("   🔄 Sent fallback response")
                 return True
             except Exception as fallback_error:
@@ -293,9 +327,34 @@ class PlatformManager:
 
         return False
 
+    def _analyze_reply_requirements(
+        self,
+        message: Message,
+        context_messages: List[Message]
+    ) -> Tuple[Tuple[str, str], Tuple[List["ToolCall"], str]]:
+        """
+        Detect the intent and required tools for replying to a message.
+
+        This has no side effects, so it can safely be run speculatively before the reply decision is known.
+
+        Returns:
+            Tuple: ((intent, intent reasoning), (required tool calls, tool reasoning))
+        """
+        intent_result = self.decision.detect_intention(
+            target_message=message,
+            person=message.sender,
+            context_messages=context_messages,
+        )
+        tools_result = self.decision.detect_required_tools(
+            target_message=message,
+            person=message.sender,
+            context_messages=context_messages,
+        )
+        return intent_result, tools_result
+
     async def _handle_no_reply(
         self,
-        platform: "BasePlatform",
+        platform_name: str,
         message: Message,
         reasoning: str
     ) -> bool:
@@ -313,7 +372,7 @@ class PlatformManager:
 
         # Even if not replying, try to save memory if message is not flagged
         self.logger.debug("   💾 Attempting memory analysis despite not replying")
-        await self._handle_memory_operations(message, sender, platform.get_platform_name())
+        await self._handle_memory_operations(message, sender, platform_name)
 
         self.logger.debug("-" * 80)
         return False
@@ -332,8 +391,7 @@ class PlatformManager:
                 platform_prefix=platform_name
             )
 
-            formatted_memory_reasoning = format_message_content_with_truncation(memory_reasoning, 300, False)
-            formatted_memory_reasoning = formatted_memory_reasoning.replace("\n", "\n     ")
+            formatted_memory_reasoning = format_indented_truncated(memory_reasoning, 300)
 
             self.logger.debug(f"   💾 Memory Analysis: {'Saved new info' if memory_saved else 'No info to save'}")
             self.logger.debug(f"   🧠 Memory Reasoning: {formatted_memory_reasoning}")
@@ -350,17 +408,26 @@ class PlatformManager:
         """Send a response with realistic typing simulation."""
         try:
             typing_delay = self._calculate_typing_delay(response)
-            self.logger.debug(f"   ⌨️ Simulating typing for {typing_delay:.1f} seconds...")
 
-            # Start typing indicator
-            await platform.start_typing(chat_id)
+            # Short responses are sent without the typing indicator to save two platform round-trips
+            min_show_chars = 20
+            if self.settings_manager:
+                min_show_chars = self.settings_manager.get('ai_behavior.typing_simulation.min_show_chars', 20)
+            show_typing = len(response) >= min_show_chars
+
+            if show_typing:
+                self.logger.debug(f"   ⌨️ Simulating typing for {typing_delay:.1f} seconds...")
+                await platform.start_typing(chat_id)
+            else:
+                self.logger.debug(f"   ⌨️ Short response, waiting {typing_delay:.1f} seconds without typing indicator...")
 
             # Wait for typing delay
             await asyncio.sleep(typing_delay)
 
             # Send message and stop typing
             success = await platform.send_message(chat_id, response)
-            await platform.stop_typing(chat_id)
+            if show_typing:
+                await platform.stop_typing(chat_id)
 
             if success:
                 self.logger.debug(f"   📏 Response Length: {len(response)} characters")
@@ -377,6 +444,145 @@ class PlatformManager:
                 self.logger.error(f"   ❌ Fallback send also failed: {fallback_error}")
                 return False
 
+    def _should_stream_response(self, platform: "BasePlatform") -> bool:
+        """Check if responses should be streamed into the chat via message edits."""
+        return bool(
+            self.settings_manager
+            and self.settings_manager.get('ai_behavior.streaming_responses.enabled', False)
+            and platform.supports_message_edits()
+        )
+
+    async def _stream_response_with_edits(
+        self,
+        platform: "BasePlatform",
+        message: Message,
+        intent: str,
+        context_messages: List[Message],
+        tool_results: Optional[Dict[str, Any]],
+        relevant_memories: Optional[str]
+    ) -> Tuple[Optional[str], bool, bool]:
+        """
+        Stream a response into the chat, sending it once the first chunk arrives and editing it as generation continues.
+
+        The input security check runs before anything is streamed; a flagged message gets the security-aware
+        response as a single send. Text streamed since the last check passes the output security check before
+        it is sent or edited in; once a check fails, or the text grows past the platform's message limit,
+        live updates stop.
+        The final text still goes through the response generator's integrity and security checks, and the
+        sent message is edited to the result.
+        If generation fails after a partial message was sent, that message is deleted, or replaced with the
+        fallback response when the platform cannot delete it.
+
+        Returns:
+            Tuple[Optional[str], bool, bool]: (Final response, whether a security breach was detected, whether it was sent)
+        """
+        chat_id = message.chat.chat_id
+        initial_chunk_chars = self.settings_manager.get('ai_behavior.streaming_responses.initial_chunk_chars', 40)
+        edit_interval = self.settings_manager.get('ai_behavior.streaming_responses.edit_interval_seconds', 1.0)
+        max_chars = platform.get_max_message_length()
+        loop = asyncio.get_running_loop()
+
+        security_response = await self.response_generator.screen_input(
+            target_message=message,
+            person=message.sender,
+            intent=intent,
+            context_messages=context_messages,
+        )
+        if security_response is not None:
+            if not security_response:
+                return security_response, True, False
+            return security_response, True, await self._send_response_with_typing(platform, chat_id, security_response)
+
+        streamed_text = ""
+        screened_chars = 0
+        sent_message_id = None
+        sent_content = ""
+        last_edit_time = 0.0
+        live_updates = True
+
+        await platform.start_typing(chat_id)
+        try:
+            async for chunk in self.response_generator.stream_response(
+                target_message=message,
+                person=message.sender,
+                intent=intent,
+                context_messages=context_messages,
+                tool_results=tool_results,
+                relevant_memories=relevant_memories,
+                extra_context=None,
+            ):
+                streamed_text += chunk
+                if not live_updates:
+                    continue
+
+                partial = streamed_text.strip()
+                if sent_message_id is None:
+                    if len(partial) < initial_chunk_chars:
+                        continue
+                elif loop.time() - last_edit_time < edit_interval or partial == sent_content:
+                    continue
+
+                # Partial text is only shown if it fits in one message and the text streamed since the
+                # last check passes the output security check, so a check never re-screens earlier text
+                if (max_chars is not None and len(partial) > max_chars) or not await asyncio.to_thread(
+                    self.response_generator.screen_streamed_text, streamed_text[screened_chars:]
+                ):
+                    live_updates = False
+                    continue
+                screened_chars = len(streamed_text)
+
+                if sent_message_id is None:
+                    await platform.stop_typing(chat_id)
+                    sent_message_id = await platform.send_editable_message(chat_id, partial)
+                    if sent_message_id is None:
+                        # Fall back to a single send once generation finishes
+                        live_updates = False
+                        await platform.start_typing(chat_id)
+                        continue
+                    sent_content = partial
+                    last_edit_time = loop.time()
+                elif await platform.edit_message(chat_id, sent_message_id, partial):
+                    sent_content = partial
+                    last_edit_time = loop.time()
+
+            final_response, security_breach = await self.response_generator.finalize_response(
+                generated_response=streamed_text.strip(),
+                target_message=message,
+                person=message.sender,
+                intent=intent,
+                context_messages=context_messages,
+                relevant_memories=relevant_memories,
+            )
+        except Exception as e:
+            if sent_message_id is None:
+                raise
+            # Never leave unvalidated partial text in the chat
+            if await platform.delete_message(chat_id, sent_message_id):
+                self.logger.debug("   🗑️ Deleted partially streamed message after a generation error")
+                raise
+            self.logger.error(f"   ❌ Error while streaming response: {e}")
+            replaced = await platform.edit_message(chat_id, sent_message_id, FALLBACK_RESPONSE)
+            self.logger.debug("   🔄 Replaced partially streamed message with fallback response")
+            return FALLBACK_RESPONSE, False, replaced
+        finally:
+            if sent_message_id is None:
+                await platform.stop_typing(chat_id)
+
+        if final_response and max_chars is not None and len(final_response) > max_chars:
+            self.logger.debug(f"   ✂️ Final response truncated from {len(final_response)} to {max_chars} characters")
+            final_response = final_response[:max_chars]
+
+        if sent_message_id is None:
+            if not final_response:
+                return final_response, security_breach, False
+            return final_response, security_breach, await platform.send_message(chat_id, final_response)
+
+        if final_response and final_response != sent_content:
+            await platform.edit_message(chat_id, sent_message_id, final_response)
+
+        self.logger.debug(f"   📏 Response Length: {len(final_response or sent_content)} characters (streamed)")
+        return final_response or sent_content, security_breach, True
+
     def _calculate_typing_delay(self, message: str) -> float:
         """
         Calculate a realistic typing delay based on message length using configurable settings.
@@ -435,31 +641,34 @@ class PlatformManager:
         try:
             from mods.agent.tools.tool import tool_manager
 
-            results = {}
-            for tool_call in tool_calls:
-                try:
-                    tool_result = tool_manager.execute_tool_call(tool_call)
-
-                    tool_key = tool_call.tool_name
-                    counter = 1
-                    while tool_key in results:
-                        tool_key = f"{tool_call.tool_name}_{counter}"
-                        counter += 1
+            # Tools are blocking and mostly I/O-bound, so run them side by side in worker threads
+            tool_outcomes = await asyncio.gather(
+                *(asyncio.to_thread(tool_manager.execute_tool_call, tool_call) for tool_call in tool_calls),
+                return_exceptions=True
+            )
 
+            results = {}
+            name_counts = Counter()
+            for tool_call, outcome in zip(tool_calls, tool_outcomes):
+                # Repeated calls to the same tool get suffixed keys: name, name_1, name_2, ...
+                idx = name_counts[tool_call.tool_name]
+                name_counts[tool_call.tool_name] += 1
+                tool_key = tool_call.tool_name if idx == 0 else f"{tool_call.tool_name}_{idx}"
+
+                if isinstance(outcome, BaseException):
                     results[tool_key] = {
-                        'success': tool_result.success,
-                        'result': tool_result.result,
-                        'error': tool_result.error,
-                        'tool_call': tool_result.tool_call.to_dict()
-                    }
-
-                except Exception as e:
-                    results[tool_call.tool_name] = {
                         'success': False,
                         'result': None,
-                        'error': f"Tool execution failed: {str(e)}",
+                        'error': f"Tool execution failed: {str(outcome)}",
                         'tool_call': tool_call.to_dict() if hasattr(tool_call, 'to_dict') else str(tool_call)
                     }
+                else:
+                    results[tool_key] = {
+                        'success': outcome.success,
+                        'result': outcome.result,
+                        'error': outcome.error,
+                        'tool_call': outcome.tool_call.to_dict()
+                    }
 
             return results
 
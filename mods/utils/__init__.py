@@ -8,7 +8,9 @@ from .message_utils import (
     is_ai_person,
     get_sender_display_name,
     format_message_content_with_truncation,
+    format_indented_truncated,
     format_message_for_context,
+    format_messages_for_context,
     analyze_message_context
 )
 
@@ -18,6 +20,8 @@ __all__ = [
     'is_ai_person',
     'get_sender_display_name',
     'format_message_content_with_truncation',
+    'format_indented_truncated',
     'format_message_for_context',
+    'format_messages_for_context',
     'analyze_message_context'
 ]
\ No newline at end of file
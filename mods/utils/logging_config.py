@@ -1,6 +1,9 @@
+import atexit
 import logging
 import os
+import queue
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Dict
 
@@ -8,10 +11,19 @@ class LoggingConfig:
     """
     Centralized logging configuration that creates date-time based folders
     and sets up loggers for different modules.
+
+    Loggers only enqueue records; a single background listener owns every
+    module's file handler, so callers never block on disk writes.
     """
     
     _loggers: Dict[str, logging.Logger] = {}
     _log_dir: Path = None
+    _FORMATTER = logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+    _queue_handler: QueueHandler = None
+    _listener: QueueListener = None
     
     @classmethod
     def setup_logging(cls) -> Path:
@@ -54,6 +66,7 @@ class LoggingConfig:
         
         # Ensure log directory is set up
         log_dir = cls.setup_logging()
+        queue_handler = cls._get_queue_handler()
         
         # Create logger
         logger = logging.getLogger(module_name)
@@ -63,20 +76,16 @@ class LoggingConfig:
         for handler in logger.handlers[:]:
             logger.removeHandler(handler)
         
-        # Create file handler
+        # Create file handler, fed by the shared listener with this module's records only
         log_file = log_dir / f"{module_name}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
-        
-        # Create formatter
-        formatter = logging.Formatter(
-            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
-        file_handler.setFormatter(formatter)
+        file_handler.setFormatter(cls._FORMATTER)
+        file_handler.addFilter(lambda record, name=module_name: record.name == name)
+        cls._listener.handlers = cls._listener.handlers + (file_handler,)
         
         # Add handler to logger
-        logger.addHandler(file_handler)
+        logger.addHandler(queue_handler)
         
         # Prevent propagation to root logger to avoid console output
         logger.propagate = False
@@ -84,6 +93,22 @@ class LoggingConfig:
         cls._loggers[module_name] = logger
         return logger
     
+    @classmethod
+    def _get_queue_handler(cls) -> QueueHandler:
+        """
+        Get the shared queue handler, starting the background listener on first use.
+        
+        Returns:
+            QueueHandler: Handler that enqueues records for the listener thread
+        """
+        if cls._queue_handler is None:
+            log_queue = queue.SimpleQueue()
+            cls._queue_handler = QueueHandler(log_queue)
+            cls._listener = QueueListener(log_queue, respect_handler_level=True)
+            cls._listener.start()
+            atexit.register(cls._listener.stop)
+        return cls._queue_handler
+    
     @classmethod
     def get_current_log_dir(cls) -> Path:
         """Get the current session's log directory."""
@@ -95,7 +120,8 @@ class LoggingConfig:
     def initialize_all_loggers(cls) -> None:
         """
         Initialize all expected loggers for the application.
-        This ensures all log files are created at startup.
+        This ensures all log files are created at startup, so later
+        get_logger calls are plain cache hits with no file I/O.
         """
         expected_loggers = [
             'response_generator',
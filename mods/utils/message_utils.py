@@ -5,7 +5,9 @@ This module provides helper functions for working with Message and Person object
 including AI message identification and message formatting utilities.
 """
 
-from typing import TYPE_CHECKING, Optional, List
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Optional, List, Mapping, Sequence, Tuple
 from ..utils.logging_config import LoggingConfig
 
 if TYPE_CHECKING:
@@ -14,13 +16,40 @@ if TYPE_CHECKING:
 
 logger = LoggingConfig.get_logger("message_utils")
 
+# A conversation counts as active if its last message is newer than this
+_FIVE_MIN = timedelta(minutes=5)
+
+# Shared read-only result for analyzing an empty message list
+_EMPTY_ANALYSIS = MappingProxyType({
+    "total_messages": 0,
+    "ai_messages": 0,
+    "user_messages": 0,
+    "last_sender_was_ai": False,
+    "conversation_active": False
+})
+
+# Message boundary and truncation markers
+_MS = "[MESSAGE START] "
+_ME = " [MESSAGE END]"
+_TRUNC_A = "... [TRUNCATED - "
+_TRUNC_B = " chars cut]"
+
+# Two-digit strings for 0-99, used to build HH:MM:SS timestamps without strftime
+_TD = tuple(f"{i:02d}" for i in range(100))
+
+def _fmt_hms(dt) -> str:
+    """Format a timestamp as HH:MM:SS, falling back to strftime for non-datetime values."""
+    if isinstance(dt, datetime):
+        return f"{_TD[dt.hour]}:{_TD[dt.minute]}:{_TD[dt.second]}"
+    return dt.strftime('%H:%M:%S')
+
 def is_ai_message(message: "Message") -> bool:
     """
     Determine if a message was sent by the AI assistant.
     
     This function checks if the message sender is the AI by looking for 'ai_assistant'
-    in the sender's identifiers list, which is more reliable than checking person_id
-    since person_id contains the actual platform user ID.
+    in the sender's identifiers (precomputed on the Person), which is more reliable than
+    checking person_id since person_id contains the actual platform user ID.
     
     Args:
         message (Message): The message to check
@@ -28,12 +57,12 @@ def is_ai_message(message: "Message") -> bool:
     Returns:
         bool: True if the message was sent by the AI, False otherwise
     """
-    if not message or not message.sender:
+    if not message:
         return False
     
-    # Check if 'ai_assistant' is in the sender's identifiers
-    sender_identifiers = message.sender.get_identifiers()
-    return 'ai_assistant' in sender_identifiers
+    # Person precomputes whether 'ai_assistant' is among its identifiers
+    sender = message.sender
+    return sender is not None and sender._is_ai
 
 def is_ai_person(person: "Person") -> bool:
     """
@@ -45,12 +74,29 @@ def is_ai_person(person: "Person") -> bool:
     Returns:
         bool: True if the person is the AI, False otherwise
     """
-    if not person:
-        return False
+    return person is not None and person._is_ai
+
+def _resolve_sender(message: "Message", include_ai_indicator: bool = True) -> Tuple[str, bool]:
+    """
+    Resolve the sender's display name and AI status with a single sender lookup.
     
-    # Check if 'ai_assistant' is in the person's identifiers
-    identifiers = person.get_identifiers()
-    return 'ai_assistant' in identifiers
+    Args:
+        message (Message): The message to resolve the sender for
+        include_ai_indicator (bool): Whether to show "**YOU** (AI)" for AI messages
+        
+    Returns:
+        Tuple[str, bool]: (Display name for the sender, whether the sender is the AI)
+    """
+    sender = message.sender if message else None
+    if not sender:
+        return "Unknown", False
+    
+    if sender._is_ai:
+        return ("**YOU** (AI)" if include_ai_indicator else "AI"), True
+    
+    # For human users, use the first non-ID identifier (usually username) cached on the Person,
+    # which falls back to person_id if no good identifier exists
+    return sender._display_name, False
 
 def get_sender_display_name(message: "Message", include_ai_indicator: bool = True) -> str:
     """
@@ -63,24 +109,7 @@ def get_sender_display_name(message: "Message", include_ai_indicator: bool = Tru
     Returns:
         str: Display name for the sender
     """
-    if not message or not message.sender:
-        return "Unknown"
-    
-    if is_ai_message(message):
-        return "**YOU** (AI)" if include_ai_indicator else "AI"
-    
-    # For human users, try to get a friendly display name
-    sender = message.sender
-    identifiers = sender.get_identifiers()
-    
-    # Use the first non-ID identifier if available (usually username)
-    for identifier in identifiers:
-        # Skip if it looks like a numeric ID
-        if not identifier.isdigit():
-            return identifier
-    
-    # Fallback to person_id if no good identifier found
-    return sender.person_id
+    return _resolve_sender(message, include_ai_indicator)[0]
 
 def format_message_content_with_truncation(
     content: str, 
@@ -96,27 +125,60 @@ def format_message_content_with_truncation(
         show_boundaries (bool): Whether to show [MESSAGE START]/[MESSAGE END] boundaries
         
     Returns:
-        str: Formatted content with truncation indicators
+        str: Formatted content with truncation indicators. Already-clean content that needs
+            neither boundaries nor truncation is returned as the same object, without copying.
     """
     if not content:
         return ""
     
-    # Clean up the content
-    content = content.strip()
+    # Clean up the content (skip the copy when there is nothing to strip)
+    if content[0].isspace() or content[-1].isspace():
+        content = content.strip()
     
     if max_length is None or len(content) <= max_length:
         # No truncation needed
         if show_boundaries:
-            return f"[MESSAGE START] {content} [MESSAGE END]"
+            return _MS + content + _ME
         return content
     
     # Truncation needed
     truncated = content[:max_length].rstrip()
+    cut = len(content) - len(truncated)
     
     if show_boundaries:
-        return f"[MESSAGE START] {truncated}... [TRUNCATED - {len(content) - len(truncated)} chars cut] [MESSAGE END]"
+        return "".join((_MS, truncated, _TRUNC_A, str(cut), _TRUNC_B, _ME))
     else:
-        return f"{truncated}... [TRUNCATED - {len(content) - len(truncated)} chars cut]"
+        return "".join((truncated, _TRUNC_A, str(cut), _TRUNC_B))
+
+def format_indented_truncated(
+    text: str,
+    max_length: Optional[int] = None,
+    indent: str = "     "
+) -> str:
+    """
+    Truncate text like `format_message_content_with_truncation` (without boundaries)
+    and indent its continuation lines for multi-line log output.
+    
+    Args:
+        text (str): The text to format
+        max_length (Optional[int]): Maximum length before truncation
+        indent (str): Prefix added after every newline
+        
+    Returns:
+        str: Truncated text with continuation lines indented
+    """
+    if not text:
+        return ""
+    
+    text = text.strip()
+    
+    if max_length is None or len(text) <= max_length:
+        return text.replace("\n", "\n" + indent)
+    
+    # Only the kept part can contain newlines, so indent it before adding the suffix
+    truncated = text[:max_length].rstrip()
+    indented = truncated.replace("\n", "\n" + indent)
+    return "".join((indented, _TRUNC_A, str(len(text) - len(truncated)), _TRUNC_B))
 
 def format_message_for_context(
     message: "Message",
@@ -142,12 +204,12 @@ def format_message_for_context(
         return "[INVALID MESSAGE]"
     
     # Get sender display name
-    sender_name = get_sender_display_name(message, include_ai_indicator=True) if include_sender_info else ""
+    sender_name = _resolve_sender(message, include_ai_indicator=True)[0] if include_sender_info else ""
     
     # Format timestamp
     timestamp = ""
     if include_timestamp and message.created_at:
-        timestamp = f"[{message.created_at.strftime('%H:%M:%S')}] "
+        timestamp = f"[{_fmt_hms(message.created_at)}] "
     
     # Format content with truncation
     formatted_content = format_message_content_with_truncation(
@@ -162,7 +224,59 @@ def format_message_for_context(
     else:
         return f"{timestamp}{formatted_content}"
 
-def analyze_message_context(messages: List["Message"]) -> dict:
+def format_messages_for_context(
+    messages: Sequence["Message"],
+    max_content_length: Optional[int] = None,
+    include_timestamp: bool = True,
+    include_sender_info: bool = True,
+    show_message_boundaries: bool = True,
+    show_full_recent: int = 0,
+    line_prefix: str = ""
+) -> str:
+    """
+    Format a list of messages for display in conversation context, one per line.
+    
+    Produces the same lines as calling `format_message_for_context` per message, but
+    builds them in a single pass and joins once.
+    
+    Args:
+        messages (Sequence[Message]): The messages to format, oldest first
+        max_content_length (Optional[int]): Maximum content length before truncation
+        include_timestamp (bool): Whether to include timestamps
+        include_sender_info (bool): Whether to include sender information
+        show_message_boundaries (bool): Whether to show message boundaries
+        show_full_recent (int): Number of most recent messages to show without truncation
+        line_prefix (str): Prefix added to every line (e.g. indentation)
+        
+    Returns:
+        str: Formatted messages separated by newlines
+    """
+    parts = []
+    append = parts.append
+    full_from = len(messages) - show_full_recent
+    
+    for i, message in enumerate(messages):
+        if not message:
+            append(line_prefix + "[INVALID MESSAGE]")
+            continue
+        
+        created_at = message.created_at
+        timestamp = f"[{_fmt_hms(created_at)}] " if include_timestamp and created_at else ""
+        
+        content = format_message_content_with_truncation(
+            message.content,
+            None if i >= full_from else max_content_length,
+            show_message_boundaries
+        )
+        
+        if include_sender_info:
+            append(f"{line_prefix}{timestamp}{_resolve_sender(message)[0]}: {content}")
+        else:
+            append(f"{line_prefix}{timestamp}{content}")
+    
+    return "\n".join(parts)
+
+def analyze_message_context(messages: List["Message"]) -> Mapping:
     """
     Analyze a list of messages to provide context information.
     
@@ -170,44 +284,38 @@ def analyze_message_context(messages: List["Message"]) -> dict:
         messages (List[Message]): List of messages to analyze
         
     Returns:
-        dict: Analysis results including AI/user message counts, timing info, etc.
+        Mapping: Analysis results including AI/user message counts, timing info, etc.
+            The result for an empty list is a shared read-only mapping; copy it with
+            dict() before modifying.
     """
     if not messages:
-        return {
-            "total_messages": 0,
-            "ai_messages": 0,
-            "user_messages": 0,
-            "last_sender_was_ai": False,
-            "conversation_active": False
-        }
+        return _EMPTY_ANALYSIS
     
+    n = len(messages)
     ai_count = 0
-    user_count = 0
+    last_sender_was_ai = False
     
+    # Inlined is_ai_message: read the precomputed flag directly instead of a call per message
     for msg in messages:
-        if is_ai_message(msg):
-            ai_count += 1
-        else:
-            user_count += 1
+        sender = msg.sender if msg else None
+        last_sender_was_ai = sender is not None and sender._is_ai
+        ai_count += last_sender_was_ai
     
-    last_message = messages[-1] if messages else None
-    last_sender_was_ai = is_ai_message(last_message) if last_message else False
+    user_count = n - ai_count
+    last_message = messages[-1]
     
     # Check if conversation is active (last message within 5 minutes)
     conversation_active = False
     if last_message and last_message.created_at:
-        from datetime import datetime, timezone, timedelta
-        now = datetime.now(timezone.utc)
-        time_since_last = now - last_message.created_at
-        conversation_active = time_since_last < timedelta(minutes=5)
+        conversation_active = datetime.now(timezone.utc) - last_message.created_at < _FIVE_MIN
     
     return {
-        "total_messages": len(messages),
+        "total_messages": n,
         "ai_messages": ai_count,
         "user_messages": user_count,
         "last_sender_was_ai": last_sender_was_ai,
         "conversation_active": conversation_active,
-        "ai_participation_ratio": ai_count / len(messages) if messages else 0.0
+        "ai_participation_ratio": ai_count / n
     }
 
 __all__ = [
@@ -215,6 +323,8 @@ __all__ = [
     "is_ai_person", 
     "get_sender_display_name",
     "format_message_content_with_truncation",
+    "format_indented_truncated",
     "format_message_for_context",
+    "format_messages_for_context",
     "analyze_message_context"
 ]
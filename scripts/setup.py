@@ -5,29 +5,57 @@ Supports Windows, Linux, and macOS with complete dependency management
 Tested and optimized for Python 3.11.6
 """
 
+import atexit
 import os
 import sys
 import subprocess
 import platform
-import shutil
-import json
 import logging
-from datetime import datetime
+import logging.handlers
+import time
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Sequence, Set, Tuple
 
 RECOMMENDED_PYTHON = "3.11.6"
 MINIMUM_PYTHON = (3, 11)
+# Oldest pip that supports every install option used below; only older versions get upgraded
+MINIMUM_PIP = (23, 0)
+
+# Host information is resolved once; platform.* calls re-query the OS every time
+SYSTEM = platform.system()
+RELEASE = platform.release()
+MACHINE = platform.machine()
+IS_WINDOWS = SYSTEM == "Windows"
+IS_LINUX = SYSTEM == "Linux"
+IS_MACOS = SYSTEM == "Darwin"
+MAX_PARALLEL_INSTALLS = 8
+# Resolved at import, before __main__ changes into the project root
+SCRIPT_PATH = Path(__file__).resolve()
+
+# pip and uv as modules of this interpreter, so they install into the environment running setup
+PIP_BASE = (sys.executable, "-m", "pip")
+UV_BASE = (sys.executable, "-m", "uv")
+
+# Shared pip install options: reuse a persistent wheel cache and skip pip's self version check
+PIP_CACHE_DIR = Path.home() / ".cache" / "cloneme-pip"
+PIP_INSTALL_ARGS = ["--prefer-binary", "--cache-dir", str(PIP_CACHE_DIR), "--disable-pip-version-check", "--no-input"]
+# The same settings as environment variables, so pip subprocesses and any builds they spawn agree
+PIP_ENV = {**os.environ, "PIP_CACHE_DIR": str(PIP_CACHE_DIR), "PIP_DISABLE_PIP_VERSION_CHECK": "1"}
+# Every pinned package ships wheels, so never fall back to slow sdist builds on the fast paths
+WHEEL_ONLY_ARGS = ["--only-binary=:all:"]
 
 def setup_logging() -> logging.Logger:
     """Set up comprehensive logging for setup operations"""
+    import queue
+
     logs_dir = Path("logs")
     logs_dir.mkdir(exist_ok=True)
 
     setup_logs_dir = logs_dir / "setup"
     setup_logs_dir.mkdir(exist_ok=True)
 
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+    timestamp = time.strftime("%Y-%m-%d_%H-%M-%S")
     log_file = setup_logs_dir / f"setup_{timestamp}.log"
 
     logger = logging.getLogger("CloneMe_Setup")
@@ -38,11 +66,15 @@ def setup_logging() -> logging.Logger:
 
     file_handler = logging.FileHandler(log_file, encoding='utf-8')
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        '%(asctime)s - %(levelname)s - %(funcName)s:%(lineno)d - %(message)s'
-    )
+    file_formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     file_handler.setFormatter(file_formatter)
-    logger.addHandler(file_handler)
+
+    # File writes happen on the listener thread so logging never blocks the install loops
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
 
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.WARNING)
@@ -54,8 +86,8 @@ def setup_logging() -> logging.Logger:
     logger.info("CloneMe Setup Script Started")
     logger.info(f"Log file: {log_file}")
     logger.info(f"Python version: {sys.version}")
-    logger.info(f"Platform: {platform.system()} {platform.release()}")
-    logger.info(f"Architecture: {platform.machine()}")
+    logger.info(f"Platform: {SYSTEM} {RELEASE}")
+    logger.info(f"Architecture: {MACHINE}")
     logger.info(f"Working directory: {Path.cwd()}")
     logger.info("=" * 80)
 
@@ -63,67 +95,101 @@ def setup_logging() -> logging.Logger:
 
 logger = setup_logging()
 
-class Colors:
-    if platform.system() == "Windows":
-        try:
-            import ctypes
-            kernel32 = ctypes.windll.kernel32
-            version = platform.version().split('.')
-            if len(version) >= 3 and int(version[0]) >= 10:
-                kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
-        except (Exception, AttributeError, ValueError):
-            pass
+def enable_windows_ansi() -> None:
+    """Enable ANSI escape sequences in the Windows 10+ console"""
+    if not IS_WINDOWS:
+        return
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        version = platform.version().split('.')
+        if len(version) >= 3 and int(version[0]) >= 10:
+            kernel32.SetConsoleMode(kernel32.GetStdHandle(-11), 7)
+    except (Exception, AttributeError, ValueError):
+        pass
 
-    RED = '\033[91m'
-    GREEN = '\033[92m'
-    YELLOW = '\033[93m'
-    BLUE = '\033[94m'
-    MAGENTA = '\033[95m'
-    CYAN = '\033[96m'
-    WHITE = '\033[97m'
-    BOLD = '\033[1m'
-    RESET = '\033[0m'
+# Redirected output (CI logs, files) gets plain text instead of escape codes, as does NO_COLOR (https://no-color.org)
+USE_COLOR = sys.stdout is not None and sys.stdout.isatty() and not os.environ.get("NO_COLOR")
+
+def _sgr(code: str) -> str:
+    return f'\033[{code}m' if USE_COLOR else ''
+
+class Colors:
+    RED = _sgr('91')
+    GREEN = _sgr('92')
+    YELLOW = _sgr('93')
+    BLUE = _sgr('94')
+    MAGENTA = _sgr('95')
+    CYAN = _sgr('96')
+    WHITE = _sgr('97')
+    BOLD = _sgr('1')
+    RESET = _sgr('0')
+
+    # Combined SGR sequences: one escape per style instead of two
+    RED_BOLD = _sgr('1;91')
+    GREEN_BOLD = _sgr('1;92')
+    YELLOW_BOLD = _sgr('1;93')
+    BLUE_BOLD = _sgr('1;94')
+    MAGENTA_BOLD = _sgr('1;95')
+
+_LOG_METHODS = {
+    "error": logger.error,
+    "warning": logger.warning,
+    "debug": logger.debug,
+    "info": logger.info
+}
 
 def print_colored(text: str, color: str = Colors.WHITE, log_level: str = "info") -> None:
     """Print colored text with cross-platform support and logging"""
-    print(f"{color}{text}{Colors.RESET}")
+    # A single write keeps lines intact when parallel install workers print concurrently
+    sys.stdout.write("".join((color, text, Colors.RESET, "\n")))
 
     clean_text = text.strip()
     if clean_text:
-        if log_level == "error":
-            logger.error(clean_text)
-        elif log_level == "warning":
-            logger.warning(clean_text)
-        elif log_level == "debug":
-            logger.debug(clean_text)
-        else:
-            logger.info(clean_text)
+        _LOG_METHODS.get(log_level, logger.info)(clean_text)
+
+def print_block(lines: Sequence[Tuple[str, ...]]) -> None:
+    """Print several (color, text[, log_level]) lines with a single write, logging each like print_colored"""
+    out = []
+    for line in lines:
+        color, text = line[0], line[1]
+        out.append("".join((color, text, Colors.RESET)) if text else "")
+
+        clean_text = text.strip()
+        if clean_text:
+            _LOG_METHODS.get(line[2] if len(line) > 2 else "info", logger.info)(clean_text)
+
+    out.append("")
+    sys.stdout.write("\n".join(out))
+    sys.stdout.flush()
 
 def print_header():
     """Print setup header with system information"""
-    start_time = datetime.now()
     logger.info("Starting setup header display")
 
-    print_colored("=" * 80, Colors.CYAN)
-    print_colored("🤖 CloneMe - AI Digital Twin Setup Script", Colors.BOLD + Colors.MAGENTA)
-    print_colored("Fully Autonomous Cross-Platform Setup", Colors.CYAN)
-    print_colored("=" * 80, Colors.CYAN)
-    print()
+    lines = [
+        (Colors.CYAN, "=" * 80),
+        (Colors.MAGENTA_BOLD, "🤖 CloneMe - AI Digital Twin Setup Script"),
+        (Colors.CYAN, "Fully Autonomous Cross-Platform Setup"),
+        (Colors.CYAN, "=" * 80),
+        ("", "")
+    ]
 
     system_info = {
-        "Platform": f"{platform.system()} {platform.release()}",
-        "Architecture": platform.machine(),
+        "Platform": f"{SYSTEM} {RELEASE}",
+        "Architecture": MACHINE,
         "Python": f"{sys.version.split()[0]}",
         "Recommended": f"Python {RECOMMENDED_PYTHON}",
         "Working Directory": str(Path.cwd()),
-        "Setup Started": start_time.strftime("%Y-%m-%d %H:%M:%S")
+        "Setup Started": time.strftime("%Y-%m-%d %H:%M:%S")
     }
 
     logger.info("System Information:")
     for key, value in system_info.items():
-        print_colored(f"📋 {key}: {value}", Colors.WHITE)
+        lines.append((Colors.WHITE, f"📋 {key}: {value}"))
         logger.info(f"  {key}: {value}")
-    print()
+    lines.append(("", ""))
+    print_block(lines)
 
     logger.info("Header display completed")
 
@@ -139,20 +205,19 @@ def check_python_version() -> bool:
 
         if version.major < MINIMUM_PYTHON[0] or (version.major == MINIMUM_PYTHON[0] and version.minor < MINIMUM_PYTHON[1]):
             logger.error(f"Incompatible Python version: {current_version}")
-            print_colored("❌ CRITICAL: Incompatible Python version detected!", Colors.RED + Colors.BOLD, "error")
+            print_colored("❌ CRITICAL: Incompatible Python version detected!", Colors.RED_BOLD, "error")
             print_colored(f"   Current: Python {current_version}", Colors.RED, "error")
             print_colored(f"   Required: Python {MINIMUM_PYTHON[0]}.{MINIMUM_PYTHON[1]}+", Colors.YELLOW, "warning")
             print_colored(f"   Recommended: Python {RECOMMENDED_PYTHON}", Colors.GREEN)
             print()
             print_colored("🔧 Installation Instructions:", Colors.BOLD)
 
-            system_name = platform.system()
-            logger.info(f"Providing installation instructions for: {system_name}")
+            logger.info(f"Providing installation instructions for: {SYSTEM}")
 
-            if system_name == "Windows":
+            if IS_WINDOWS:
                 print_colored("   Windows: Download from https://python.org/downloads/", Colors.WHITE)
                 print_colored("   Or use: winget install Python.Python.3.11", Colors.WHITE)
-            elif system_name == "Linux":
+            elif IS_LINUX:
                 print_colored("   Ubuntu/Debian: sudo apt update && sudo apt install python3.11 python3.11-venv", Colors.WHITE)
                 print_colored("   CentOS/RHEL: sudo yum install python3.11", Colors.WHITE)
                 print_colored("   Or compile from source: https://python.org/downloads/source/", Colors.WHITE)
@@ -165,7 +230,7 @@ def check_python_version() -> bool:
 
         if current_version == RECOMMENDED_PYTHON:
             logger.info(f"Perfect Python version match: {current_version}")
-            print_colored(f"✅ PERFECT: Python {current_version} (Recommended version)", Colors.GREEN + Colors.BOLD)
+            print_colored(f"✅ PERFECT: Python {current_version} (Recommended version)", Colors.GREEN_BOLD)
         elif version >= (3, 11):
             logger.info(f"Compatible Python version: {current_version}")
             print_colored(f"✅ COMPATIBLE: Python {current_version}", Colors.GREEN)
@@ -187,12 +252,22 @@ def check_python_version() -> bool:
         print_colored(f"❌ Error checking Python version: {e}", Colors.RED, "error")
         return False
 
-def get_pip_command() -> Optional[List[str]]:
-    """Get the working pip command for this system"""
+@lru_cache(maxsize=1)
+def detect_pip() -> Optional[Tuple[Tuple[str, ...], str]]:
+    """Detect the working pip command and its version (runs at most once per process)"""
     logger.info("Starting pip command detection")
 
+    # pip importable here means `python -m pip` works; reading its version avoids starting an interpreter
+    try:
+        import pip
+        version_output = f"pip {pip.__version__} from {os.path.dirname(pip.__file__)} (python {sys.version_info.major}.{sys.version_info.minor})"
+        logger.info(f"Found pip module in this interpreter: {version_output}")
+        return PIP_BASE, version_output
+    except (ImportError, AttributeError, TypeError) as e:
+        logger.debug(f"pip is not importable in this interpreter, probing commands: {e}")
+
     pip_commands = [
-        [sys.executable, "-m", "pip"],
+        list(PIP_BASE),
         ["pip3"],
         ["pip"]
     ]
@@ -207,7 +282,7 @@ def get_pip_command() -> Optional[List[str]]:
             if result.returncode == 0:
                 logger.info(f"Found working pip command: {' '.join(cmd)}")
                 logger.debug(f"Pip version output: {result.stdout.strip()}")
-                return cmd
+                return tuple(cmd), result.stdout.strip()
         except subprocess.CalledProcessError as e:
             logger.debug(f"Pip command failed: {' '.join(cmd)} - {e}")
         except subprocess.TimeoutExpired:
@@ -220,24 +295,35 @@ def get_pip_command() -> Optional[List[str]]:
     logger.error("No working pip command found")
     return None
 
+def get_pip_command() -> Optional[List[str]]:
+    """Get the working pip command for this system"""
+    detected = detect_pip()
+    return list(detected[0]) if detected else None
+
+def parse_pip_version(version_output: str) -> Optional[Tuple[int, ...]]:
+    """Parse the (major, minor) version out of `pip --version` output"""
+    import re
+
+    match = re.match(r"pip (\d+)\.(\d+)", version_output)
+    return tuple(map(int, match.groups())) if match else None
+
 def check_pip() -> bool:
     """Check pip availability and upgrade if needed"""
     logger.info("Starting pip availability check")
 
-    pip_cmd = get_pip_command()
+    detected = detect_pip()
 
-    if pip_cmd is None:
+    if detected is None:
         logger.error("No working pip command found")
-        print_colored("❌ CRITICAL: pip is not available!", Colors.RED + Colors.BOLD, "error")
+        print_colored("❌ CRITICAL: pip is not available!", Colors.RED_BOLD, "error")
         print_colored("🔧 Installation Instructions:", Colors.BOLD)
 
-        system_name = platform.system()
-        logger.info(f"Providing pip installation instructions for: {system_name}")
+        logger.info(f"Providing pip installation instructions for: {SYSTEM}")
 
-        if system_name == "Windows":
+        if IS_WINDOWS:
             print_colored("   Download get-pip.py from https://bootstrap.pypa.io/get-pip.py", Colors.WHITE)
             print_colored("   Then run: python get-pip.py", Colors.WHITE)
-        elif system_name == "Darwin":
+        elif IS_MACOS:
             print_colored("   Try: python3 -m ensurepip --upgrade", Colors.WHITE)
             print_colored("   Or: brew install python (includes pip)", Colors.WHITE)
             print_colored("   Or: curl https://bootstrap.pypa.io/get-pip.py | python3", Colors.WHITE)
@@ -248,33 +334,23 @@ def check_pip() -> bool:
         logger.info("Pip check failed - no pip available")
         return False
 
-    try:
-        logger.debug(f"Getting pip version with command: {' '.join(pip_cmd)}")
-        result = subprocess.run(pip_cmd + ["--version"],
-                              capture_output=True, check=True, text=True, timeout=30)
-        pip_version = result.stdout.strip()
-        logger.info(f"Pip detected successfully: {pip_version}")
-        print_colored(f"✅ pip detected: {pip_version}", Colors.GREEN)
-        print_colored(f"   Using command: {' '.join(pip_cmd)}", Colors.WHITE)
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Failed to get pip version: {e}")
-        print_colored("❌ Failed to get pip version", Colors.RED, "error")
-        return False
-    except subprocess.TimeoutExpired:
-        logger.error("Pip version check timed out")
-        print_colored("❌ Pip version check timed out", Colors.RED, "error")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error getting pip version: {e}")
-        print_colored(f"❌ Unexpected error: {e}", Colors.RED, "error")
-        return False
+    pip_cmd, pip_version = list(detected[0]), detected[1]
+    logger.info(f"Pip detected successfully: {pip_version}")
+    print_colored(f"✅ pip detected: {pip_version}", Colors.GREEN)
+    print_colored(f"   Using command: {' '.join(pip_cmd)}", Colors.WHITE)
+
+    current = parse_pip_version(pip_version)
+    if current is not None and current >= MINIMUM_PIP:
+        logger.info(f"Pip {'.'.join(map(str, current))} is current enough, skipping upgrade")
+        print_colored("✅ pip is up to date", Colors.GREEN)
+        return True
     
     logger.info("Attempting to upgrade pip")
     print_colored("🔄 Upgrading pip to latest version...", Colors.BLUE)
     try:
-        upgrade_cmd = pip_cmd + ["install", "--upgrade", "pip"]
+        upgrade_cmd = pip_cmd + ["install", "--upgrade"] + PIP_INSTALL_ARGS + ["pip"]
         logger.debug(f"Running pip upgrade command: {' '.join(upgrade_cmd)}")
-        result = subprocess.run(upgrade_cmd, capture_output=True, check=True, timeout=300)
+        subprocess.run(upgrade_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=300)
         logger.info("Pip upgraded successfully")
         print_colored("✅ pip upgraded successfully", Colors.GREEN)
         return True
@@ -298,19 +374,19 @@ def check_pip() -> bool:
 
 def check_virtual_environment() -> bool:
     """Check if running in virtual environment and recommend if not"""
-    in_venv = hasattr(sys, 'real_prefix') or (hasattr(sys, 'base_prefix') and sys.base_prefix != sys.prefix)
+    in_venv = sys.prefix != sys.base_prefix
 
     if in_venv:
         venv_path = sys.prefix
         print_colored(f"✅ Virtual environment detected: {venv_path}", Colors.GREEN)
         return True
     else:
-        print_colored("⚠️  WARNING: Not running in a virtual environment!", Colors.YELLOW + Colors.BOLD)
+        print_colored("⚠️  WARNING: Not running in a virtual environment!", Colors.YELLOW_BOLD)
         print_colored("🔧 Recommended: Create a virtual environment first", Colors.YELLOW)
         print()
         print_colored("Virtual Environment Setup:", Colors.BOLD)
 
-        if platform.system() == "Windows":
+        if IS_WINDOWS:
             print_colored("   python -m venv .venv", Colors.WHITE)
             print_colored("   .venv\\Scripts\\activate", Colors.WHITE)
         else:
@@ -320,6 +396,14 @@ def check_virtual_environment() -> bool:
         print_colored("   Then run this setup script again", Colors.WHITE)
         print()
 
+        # Unattended runs (CI, piped stdin) cannot answer the prompt, so they opt in via the environment
+        if sys.stdin is None or not sys.stdin.isatty():
+            allowed = os.environ.get("CLONEME_ALLOW_NO_VENV") == "1"
+            logger.info(f"Non-interactive run, {'continuing' if allowed else 'stopping'} without virtual environment (CLONEME_ALLOW_NO_VENV)")
+            if not allowed:
+                print_colored("   Set CLONEME_ALLOW_NO_VENV=1 to continue without one in non-interactive runs", Colors.WHITE)
+            return allowed
+
         response = input("Continue without virtual environment? (y/N): ").lower().strip()
         return response in ['y', 'yes']
 
@@ -327,6 +411,7 @@ def create_directories() -> bool:
     """Create only the directories actually used by CloneMe application"""
     logger.info("Starting directory creation")
 
+    # Parents are listed before their children, so every mkdir is a single syscall
     directories = [
         "profiles",
         "profiles/examples",
@@ -342,16 +427,14 @@ def create_directories() -> bool:
 
     for directory in directories:
         try:
-            dir_path = Path(directory)
-            if not dir_path.exists():
-                logger.debug(f"Creating directory: {directory}")
-                dir_path.mkdir(parents=True, exist_ok=True)
-                print_colored(f"   ✅ Created: {directory}/", Colors.GREEN)
-                logger.info(f"Successfully created directory: {directory}")
-                created_count += 1
-            else:
-                print_colored(f"   📁 Exists: {directory}/", Colors.WHITE)
-                logger.debug(f"Directory already exists: {directory}")
+            # mkdir reports an existing directory itself, so no separate exists() check is needed
+            os.mkdir(directory)
+            print_colored(f"   ✅ Created: {directory}/", Colors.GREEN)
+            logger.info(f"Successfully created directory: {directory}")
+            created_count += 1
+        except FileExistsError:
+            print_colored(f"   📁 Exists: {directory}/", Colors.WHITE)
+            logger.debug(f"Directory already exists: {directory}")
         except PermissionError as e:
             logger.error(f"Permission denied creating directory {directory}: {e}")
             print_colored(f"   ❌ Permission denied: {directory}/", Colors.RED, "error")
@@ -384,13 +467,22 @@ def create_directories() -> bool:
     logger.info("Directory creation completed successfully")
     return True
 
-def get_exact_requirements() -> List[str]:
-    """Get exact package versions from tested environment"""
-    return [ 
-        "aiohappyeyeballs==2.6.1", "aiohttp==3.12.9", "aiosignal==1.3.2", "annotated-types==0.7.0", "anthropic==0.52.2", "anyio==4.9.0", "attrs==25.3.0", "beautifulsoup4==4.13.4", "cachetools==5.5.2", "certifi==2025.4.26", "cffi==1.17.1", "charset-normalizer==3.4.2", "click==8.2.1", "colorama==0.4.6", "curl_cffi==0.11.2", "dataclasses-json==0.6.7", "discord-protos==0.0.2", "distro==1.9.0", "duckduckgo_search==8.0.2", "filetype==1.2.0", "frozenlist==1.6.2", "google-ai-generativelanguage==0.6.15", "google-api-core==2.25.0", "google-api-python-client==2.171.0", "google-auth==2.40.3", "google-auth-httplib2==0.2.0", "google-generativeai==0.8.5", "googleapis-common-protos==1.70.0", "googlesearch-python==1.3.0", "greenlet==3.2.3", "groq==0.26.0", "grpcio==1.72.1", "grpcio-status==1.71.0", "h11==0.16.0", "httpcore==1.0.9", "httplib2==0.22.0", "httpx==0.28.1", "httpx-sse==0.4.0", "idna==3.10", "jiter==0.10.0", "jsonpatch==1.33", "jsonpointer==3.0.0", "langchain==0.3.25", "langchain-anthropic==0.3.15", "langchain-community==0.3.24",
-        "langchain-core==0.3.64","langchain-google-genai==2.0.10","langchain-groq==0.3.2","langchain-ollama==0.3.3","langchain-openai==0.3.19","langchain-text-splitters==0.3.8","langsmith==0.3.45","lxml==5.4.0","marshmallow==3.26.1","multidict==6.4.4","mypy_extensions==1.1.0","numpy==2.2.6","ollama==0.5.1","openai==1.84.0","orjson==3.10.18","packaging==24.2","primp==0.15.0","propcache==0.3.1","proto-plus==1.26.1","protobuf==5.29.5","pyasn1==0.6.1","pyasn1_modules==0.4.2","pycparser==2.22",
-        "pydantic==2.11.5", "pydantic-settings==2.9.1", "pydantic_core==2.33.2", "PyNaCl==1.5.0", "pyparsing==3.2.3", "python-dotenv==1.1.0", "PyYAML==6.0.2", "regex==2024.11.6", "requests==2.32.3", "requests-toolbelt==1.0.0", "rsa==4.9.1", "sniffio==1.3.1", "soupsieve==2.7", "SQLAlchemy==2.0.41", "tenacity==9.1.2", "tiktoken==0.9.0", "tqdm==4.67.1", "typing-inspect==0.9.0", "typing-inspection==0.4.1", "typing_extensions==4.14.0", "tzdata==2025.2", "tzlocal==5.3.1", "uritemplate==4.2.0", "urllib3==2.4.0", "watchdog==6.0.0", "yarl==1.20.0", "zstandard==0.23.0"
-    ]
+# discord.py-self is only installable from git at the tested commit
+DISCORD_PY_SELF_COMMIT = "71609f4f62649d18bdf14f0e286b7e62bc605390"
+DISCORD_PY_SELF_URL = f"git+https://github.com/dolfies/discord.py-self.git@{DISCORD_PY_SELF_COMMIT}"
+
+# Exact package versions from the tested environment, one requirement per line
+REQUIREMENTS_LOCK_FILE = SCRIPT_PATH.parent / "requirements.lock.txt"
+
+def load_locked_requirements() -> Tuple[str, ...]:
+    """Read the pinned requirements from the lock file next to this script"""
+    requirements = []
+    with open(REQUIREMENTS_LOCK_FILE, encoding="utf-8") as f:
+        for line in f:
+            line = line.split("#", 1)[0].strip()
+            if line:
+                requirements.append(line)
+    return tuple(requirements)
 
 def install_discord_py_self() -> bool:
     """Install discord.py-self from git repository"""
@@ -403,14 +495,12 @@ def install_discord_py_self() -> bool:
         print_colored("❌ Failed to install discord.py-self: pip not available", Colors.RED, "error")
         return False
 
-    git_url = "git+https://github.com/dolfies/discord.py-self.git@71609f4f62649d18bdf14f0e286b7e62bc605390"
-    install_cmd = pip_cmd + ["install", git_url]
+    install_cmd = pip_cmd + ["install"] + PIP_INSTALL_ARGS + [DISCORD_PY_SELF_URL]
 
     try:
         logger.debug(f"Running discord.py-self install command: {' '.join(install_cmd)}")
-        result = subprocess.run(install_cmd, check=True, capture_output=True, text=True, timeout=300)
+        subprocess.run(install_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=300)
         logger.info("discord.py-self installed successfully")
-        logger.debug(f"Install output: {result.stdout}")
         print_colored("✅ discord.py-self installed successfully", Colors.GREEN)
         return True
     except subprocess.CalledProcessError as e:
@@ -428,26 +518,288 @@ def install_discord_py_self() -> bool:
         print_colored(f"❌ Unexpected error: {e}", Colors.RED, "error")
         return False
 
+def get_parallel_workers() -> int:
+    """Get the number of concurrent pip batches (override with --parallel=N, 1 = sequential)"""
+    for arg in sys.argv[1:]:
+        if arg.startswith("--parallel="):
+            try:
+                return max(1, int(arg.split("=", 1)[1]))
+            except ValueError:
+                logger.warning(f"Ignoring invalid {arg} argument")
+    return min(MAX_PARALLEL_INSTALLS, (os.cpu_count() or 1) * 2)
+
+def install_batch(pip_cmd: List[str], batch: Sequence[str], batch_num: int, total_batches: int) -> Tuple[bool, List[str]]:
+    """Install one batch of packages, retrying individually if the batch fails"""
+    logger.info(f"Installing batch {batch_num}/{total_batches}: {batch}")
+    print_colored(f"🔄 Installing batch {batch_num}/{total_batches} ({len(batch)} packages)...", Colors.BLUE)
+
+    # The pinned list is transitively closed, so every batch skips dependency resolution, sequential or
+    # parallel; concurrent batches then cannot race each other over shared dependencies either
+    extra_args = ["--no-deps"]
+    failed_packages = []
+
+    try:
+        cmd = pip_cmd + ["install"] + WHEEL_ONLY_ARGS + PIP_INSTALL_ARGS + extra_args + list(batch)
+        logger.debug(f"Running batch install command: {' '.join(cmd)}")
+        batch_start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=1200)
+        batch_duration = time.perf_counter() - batch_start
+
+        logger.info(f"Batch {batch_num} completed successfully in {batch_duration:.1f}s")
+        print_colored(f"   ✅ Batch {batch_num} completed successfully ({batch_duration:.1f}s)", Colors.GREEN)
+        return True, failed_packages
+    except subprocess.CalledProcessError as e:
+        error_msg = e.stderr if e.stderr else str(e)
+        logger.error(f"Batch {batch_num} failed: {error_msg}")
+        print_colored(f"   ❌ Batch {batch_num} failed", Colors.RED, "error")
+        print_colored(f"   Error: {error_msg[:200]}...", Colors.RED, "error")
+
+        logger.info(f"Attempting individual installation for batch {batch_num}")
+        print_colored(f"   🔄 Trying individual package installation...", Colors.YELLOW)
+        for pkg in batch:
+            try:
+                # Without --only-binary, so a package lacking a wheel for this platform can still build
+                individual_cmd = pip_cmd + ["install"] + PIP_INSTALL_ARGS + extra_args + [pkg]
+                subprocess.run(individual_cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=300)
+                logger.debug(f"Individual install succeeded: {pkg}")
+            except subprocess.CalledProcessError:
+                logger.error(f"Individual install failed: {pkg}")
+                failed_packages.append(pkg)
+            except subprocess.TimeoutExpired:
+                logger.error(f"Individual install timed out: {pkg}")
+                failed_packages.append(pkg)
+            except Exception as e:
+                logger.error(f"Individual install error for {pkg}: {e}")
+                failed_packages.append(pkg)
+    except subprocess.TimeoutExpired:
+        logger.error(f"Batch {batch_num} timed out")
+        print_colored(f"   ❌ Batch {batch_num} timed out", Colors.RED, "error")
+        failed_packages.extend(batch)
+    except Exception as e:
+        logger.error(f"Unexpected error in batch {batch_num}: {e}")
+        print_colored(f"   ❌ Batch {batch_num} unexpected error: {e}", Colors.RED, "error")
+        failed_packages.extend(batch)
+
+    return False, failed_packages
+
+def canonicalize_name(name: str) -> str:
+    """Normalize a distribution name as described in PEP 503"""
+    import re
+
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+def get_missing_requirements(requirements: Sequence[str]) -> List[str]:
+    """Return the pinned requirements that are not installed at exactly the pinned version"""
+    from importlib import metadata
+
+    installed = {}
+    for dist in metadata.distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed[canonicalize_name(name)] = dist.version
+
+    missing = []
+    for requirement in requirements:
+        name, version = requirement.split("==", 1)
+        if installed.get(canonicalize_name(name)) != version:
+            missing.append(requirement)
+    return missing
+
+def is_discord_py_self_current() -> bool:
+    """Check whether discord.py-self is installed from the pinned git commit (per its PEP 610 direct_url.json)"""
+    import json
+    from importlib import metadata
+
+    try:
+        direct_url = metadata.distribution("discord.py-self").read_text("direct_url.json")
+    except metadata.PackageNotFoundError:
+        return False
+    if not direct_url:
+        return False
+    try:
+        commit_id = json.loads(direct_url).get("vcs_info", {}).get("commit_id")
+    except (ValueError, AttributeError):
+        return False
+    return commit_id == DISCORD_PY_SELF_COMMIT
+
+def install_batches(pip_cmd: List[str], requirements: Sequence[str]) -> List[str]:
+    """Install requirements in batches of 10 and return the packages that failed"""
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+
+    batch_size = 10
+    batches = [requirements[i:i + batch_size] for i in range(0, len(requirements), batch_size)]
+    total_batches = len(batches)
+    workers = min(get_parallel_workers(), total_batches)
+    failed_packages = []
+    successful_batches = 0
+
+    if workers > 1:
+        logger.info(f"Installing {total_batches} batches with {workers} parallel workers")
+        print_colored(f"   Running {workers} installs in parallel (use --parallel=1 to install sequentially)", Colors.WHITE)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(install_batch, pip_cmd, batch, batch_num, total_batches)
+                for batch_num, batch in enumerate(batches, 1)
+            ]
+            for future in as_completed(futures):
+                succeeded, batch_failures = future.result()
+                successful_batches += succeeded
+                failed_packages.extend(batch_failures)
+    else:
+        for batch_num, batch in enumerate(batches, 1):
+            succeeded, batch_failures = install_batch(pip_cmd, batch, batch_num, total_batches)
+            successful_batches += succeeded
+            failed_packages.extend(batch_failures)
+
+    logger.info(f"Successful batches: {successful_batches}/{total_batches}")
+    return failed_packages
+
+def run_pip_in_process(args: List[str]) -> Optional[Tuple[int, str]]:
+    """Run pip inside this interpreter, returning (exit code, stderr) or None if unavailable"""
+    import contextlib
+    import io
+
+    try:
+        # pip does not guarantee its internal API, so any import problem means "use a subprocess"
+        from pip._internal.cli.main import main as pip_main
+    except ImportError:
+        return None
+
+    # pip configures the root logger for its own output; restore it so setup logging is unaffected
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    stderr = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(stderr):
+            return_code = pip_main(args)
+    except SystemExit as e:
+        return_code = 0 if e.code is None else e.code if isinstance(e.code, int) else 1
+    finally:
+        root.handlers[:] = saved_handlers
+        root.setLevel(saved_level)
+
+    return return_code, stderr.getvalue()
+
+def ensure_uv(pip_cmd: List[str]) -> bool:
+    """Make uv available to this interpreter, bootstrapping it with pip if needed (disable with --no-uv)"""
+    from importlib.util import find_spec
+
+    # uv runs as `python -m uv`, so it must live in the same interpreter pip installs into
+    if "--no-uv" in sys.argv[1:] or tuple(pip_cmd) != PIP_BASE:
+        return False
+    if find_spec("uv") is not None:
+        return True
+
+    logger.info("uv not found, bootstrapping it with pip")
+    print_colored("🔄 Installing uv for faster package installation...", Colors.BLUE)
+    try:
+        subprocess.run(pip_cmd + ["install"] + PIP_INSTALL_ARGS + WHEEL_ONLY_ARGS + ["uv"],
+                      check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=300)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"uv bootstrap failed, using pip: {e.stderr if e.stderr else e}")
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"uv bootstrap failed, using pip: {e}")
+    return False
+
+def install_with_uv(requirements_file: str) -> bool:
+    """Install a requirements file with uv's parallel downloader; returns False so pip can take over"""
+    # --python targets this interpreter whether or not it is a virtual environment
+    cmd = [*UV_BASE, "pip", "install", "--python", sys.executable, "--no-deps", "-r", requirements_file]
+    print_colored("🔄 Installing all packages with uv...", Colors.BLUE)
+
+    try:
+        logger.debug(f"Running uv install command: {' '.join(cmd)}")
+        install_start = time.perf_counter()
+        subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=1800)
+        install_duration = time.perf_counter() - install_start
+
+        logger.info(f"uv install completed successfully in {install_duration:.1f}s")
+        print_colored(f"   ✅ Packages installed successfully ({install_duration:.1f}s)", Colors.GREEN)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.warning(f"uv install failed, falling back to pip: {e.stderr if e.stderr else e}")
+    except (subprocess.TimeoutExpired, OSError) as e:
+        logger.warning(f"uv install failed, falling back to pip: {e}")
+    print_colored("   ⚠️  uv install failed, falling back to pip", Colors.YELLOW, "warning")
+    return False
+
+def install_requirements_file(pip_cmd: List[str], requirements: Sequence[str]) -> bool:
+    """Install the given requirements (pins and URLs) with a single pip invocation"""
+    # Imported here: only this install path needs it, and tempfile pulls in shutil and random
+    import tempfile
+
+    # delete=False so pip can open the file on Windows while it still exists
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False, encoding="utf-8") as f:
+        f.write("\n".join(requirements))
+        requirements_file = f.name
+
+    # Every package is pinned and the list is transitively closed, so skip dependency resolution.
+    # No --only-binary here: the discord.py-self git URL always builds, and the pins all have wheels
+    cmd = pip_cmd + ["install"] + PIP_INSTALL_ARGS + ["--no-deps", "-r", requirements_file]
+
+    try:
+        if ensure_uv(pip_cmd) and install_with_uv(requirements_file):
+            return True
+
+        print_colored("🔄 Installing all packages in a single pip run...", Colors.BLUE)
+        logger.debug(f"Running requirements install command: {' '.join(cmd)}")
+        install_start = time.perf_counter()
+        # This is the only pip run that never happens concurrently, so it can skip process startup
+        outcome = run_pip_in_process(cmd[len(pip_cmd):]) if tuple(pip_cmd) == PIP_BASE else None
+        if outcome is None:
+            subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, env=PIP_ENV, timeout=1800)
+        elif outcome[0] != 0:
+            raise subprocess.CalledProcessError(outcome[0], cmd, stderr=outcome[1])
+        install_duration = time.perf_counter() - install_start
+
+        logger.info(f"Single-run install completed successfully in {install_duration:.1f}s")
+        print_colored(f"   ✅ Packages installed successfully ({install_duration:.1f}s)", Colors.GREEN)
+        return True
+    except subprocess.CalledProcessError as e:
+        error_msg = e.stderr if e.stderr else str(e)
+        logger.error(f"Single-run install failed: {error_msg}")
+        print_colored("   ❌ Single-run install failed", Colors.RED, "error")
+        print_colored(f"   Error: {error_msg[:200]}...", Colors.RED, "error")
+    except subprocess.TimeoutExpired:
+        logger.error("Single-run install timed out")
+        print_colored("   ❌ Single-run install timed out", Colors.RED, "error")
+    except Exception as e:
+        logger.error(f"Unexpected error in single-run install: {e}")
+        print_colored(f"   ❌ Single-run install unexpected error: {e}", Colors.RED, "error")
+    finally:
+        try:
+            os.unlink(requirements_file)
+        except OSError as e:
+            logger.debug(f"Could not remove temporary requirements file {requirements_file}: {e}")
+
+    return False
+
 def install_requirements() -> bool:
     """Install all Python packages with exact versions"""
     logger.info("Starting requirements installation")
-    start_time = datetime.now()
+    start_time = time.perf_counter()
 
-    print_colored("📦 Installing Python packages with exact tested versions...", Colors.BLUE + Colors.BOLD)
+    print_colored("📦 Installing Python packages with exact tested versions...", Colors.BLUE_BOLD)
     print_colored("   This ensures maximum compatibility and stability", Colors.WHITE)
     print()
 
-    system_name = platform.system()
-    if system_name == "Linux":
-        print_colored("ℹ️  Note: Some packages may require build tools if wheels are unavailable:", Colors.CYAN)
-        print_colored("   Ubuntu/Debian: sudo apt install build-essential libssl-dev libffi-dev", Colors.WHITE)
-        print_colored("   CentOS/RHEL: sudo yum groupinstall 'Development Tools'", Colors.WHITE)
-    elif system_name == "Darwin":
-        print_colored("ℹ️  Note: Some packages may require Xcode command line tools:", Colors.CYAN)
-        print_colored("   Run: xcode-select --install", Colors.WHITE)
-    elif system_name == "Windows":
-        print_colored("ℹ️  Note: Some packages may require Visual C++ Build Tools:", Colors.CYAN)
-        print_colored("   Download from: https://visualstudio.microsoft.com/visual-cpp-build-tools/", Colors.WHITE)
+    if IS_LINUX:
+        print_block([
+            (Colors.CYAN, "ℹ️  Note: Some packages may require build tools if wheels are unavailable:"),
+            (Colors.WHITE, "   Ubuntu/Debian: sudo apt install build-essential libssl-dev libffi-dev"),
+            (Colors.WHITE, "   CentOS/RHEL: sudo yum groupinstall 'Development Tools'"),
+        ])
+    elif IS_MACOS:
+        print_block([
+            (Colors.CYAN, "ℹ️  Note: Some packages may require Xcode command line tools:"),
+            (Colors.WHITE, "   Run: xcode-select --install"),
+        ])
+    elif IS_WINDOWS:
+        print_block([
+            (Colors.CYAN, "ℹ️  Note: Some packages may require Visual C++ Build Tools:"),
+            (Colors.WHITE, "   Download from: https://visualstudio.microsoft.com/visual-cpp-build-tools/"),
+        ])
     print()
 
     pip_cmd = get_pip_command()
@@ -456,74 +808,54 @@ def install_requirements() -> bool:
         print_colored("❌ Failed to install requirements: pip not available", Colors.RED, "error")
         return False
 
-    requirements = get_exact_requirements()
-    total_packages = len(requirements)
-    logger.info(f"Installing {total_packages} packages using pip command: {' '.join(pip_cmd)}")
-
-    print_colored(f"📋 Installing {total_packages} packages...", Colors.WHITE)
-    print_colored(f"   Using pip command: {' '.join(pip_cmd)}", Colors.WHITE)
-
-    batch_size = 10
-    failed_packages = []
-    successful_batches = 0
-
-    for i in range(0, len(requirements), batch_size):
-        batch = requirements[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(requirements) + batch_size - 1) // batch_size
-
-        logger.info(f"Installing batch {batch_num}/{total_batches}: {batch}")
-        print_colored(f"🔄 Installing batch {batch_num}/{total_batches} ({len(batch)} packages)...", Colors.BLUE)
+    # Create the shared cache up front so parallel batches do not race to create it
+    try:
+        PIP_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    except OSError as e:
+        logger.warning(f"Could not create pip cache directory {PIP_CACHE_DIR}: {e}")
 
-        try:
-            cmd = pip_cmd + ["install"] + batch
-            logger.debug(f"Running batch install command: {' '.join(cmd)}")
-            batch_start = datetime.now()
-            result = subprocess.run(cmd, check=True, capture_output=True, text=True, timeout=1200)
-            batch_duration = datetime.now() - batch_start
-
-            logger.info(f"Batch {batch_num} completed successfully in {batch_duration.total_seconds():.1f}s")
-            logger.debug(f"Batch {batch_num} output: {result.stdout}")
-            print_colored(f"   ✅ Batch {batch_num} completed successfully ({batch_duration.total_seconds():.1f}s)", Colors.GREEN)
-            successful_batches += 1
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
-            logger.error(f"Batch {batch_num} failed: {error_msg}")
-            print_colored(f"   ❌ Batch {batch_num} failed", Colors.RED, "error")
-            print_colored(f"   Error: {error_msg[:200]}...", Colors.RED, "error")
-
-            logger.info(f"Attempting individual installation for batch {batch_num}")
-            print_colored(f"   🔄 Trying individual package installation...", Colors.YELLOW)
-            for pkg in batch:
-                try:
-                    individual_cmd = pip_cmd + ["install", pkg]
-                    subprocess.run(individual_cmd, check=True, capture_output=True, text=True, timeout=300)
-                    logger.debug(f"Individual install succeeded: {pkg}")
-                except subprocess.CalledProcessError:
-                    logger.error(f"Individual install failed: {pkg}")
-                    failed_packages.append(pkg)
-                except subprocess.TimeoutExpired:
-                    logger.error(f"Individual install timed out: {pkg}")
-                    failed_packages.append(pkg)
-                except Exception as e:
-                    logger.error(f"Individual install error for {pkg}: {e}")
-                    failed_packages.append(pkg)
-        except subprocess.TimeoutExpired:
-            logger.error(f"Batch {batch_num} timed out")
-            print_colored(f"   ❌ Batch {batch_num} timed out", Colors.RED, "error")
-            failed_packages.extend(batch)
-        except Exception as e:
-            logger.error(f"Unexpected error in batch {batch_num}: {e}")
-            print_colored(f"   ❌ Batch {batch_num} unexpected error: {e}", Colors.RED, "error")
-            failed_packages.extend(batch)
+    try:
+        pinned = load_locked_requirements()
+    except OSError as e:
+        logger.error(f"Cannot read {REQUIREMENTS_LOCK_FILE}: {e}")
+        print_colored(f"❌ Failed to read {REQUIREMENTS_LOCK_FILE.name}: {e}", Colors.RED, "error")
+        return False
 
-    logger.info("Installing discord.py-self separately")
-    if not install_discord_py_self():
-        failed_packages.append("discord.py-self")
+    total_packages = len(pinned)
+    # Only hand pip what is missing, so re-running setup does not re-check every package
+    requirements = get_missing_requirements(pinned)
+    logger.info(f"{total_packages - len(requirements)}/{total_packages} pinned packages already installed")
 
-    total_duration = datetime.now() - start_time
-    logger.info(f"Requirements installation completed in {total_duration.total_seconds():.1f}s")
-    logger.info(f"Successful batches: {successful_batches}/{total_batches}")
+    failed_packages = []
+    if not requirements:
+        logger.info("All pinned packages are up to date")
+        print_colored(f"✅ All {total_packages} pinned packages are already installed", Colors.GREEN)
+    else:
+        logger.info(f"Installing {len(requirements)} packages using pip command: {' '.join(pip_cmd)}")
+        print_colored(f"📋 Installing {len(requirements)} of {total_packages} packages...", Colors.WHITE)
+        print_colored(f"   Using pip command: {' '.join(pip_cmd)}", Colors.WHITE)
+
+    # discord.py-self joins the single run only when it is missing or installed from another commit
+    discord_current = is_discord_py_self_current()
+    if discord_current:
+        logger.info(f"discord.py-self already installed at commit {DISCORD_PY_SELF_COMMIT}")
+        print_colored("✅ discord.py-self is already installed at the pinned commit", Colors.GREEN)
+    to_install = requirements if discord_current else requirements + [DISCORD_PY_SELF_URL]
+
+    if to_install and not install_requirements_file(pip_cmd, to_install):
+        # Batches narrow a failure down to the packages that actually failed
+        logger.info("Falling back to batched installation")
+        print_colored("   🔄 Falling back to batched installation to find failing packages...", Colors.YELLOW)
+        if requirements:
+            failed_packages = install_batches(pip_cmd, requirements)
+
+        if not discord_current:
+            logger.info("Installing discord.py-self separately")
+            if not install_discord_py_self():
+                failed_packages.append("discord.py-self")
+
+    total_duration = time.perf_counter() - start_time
+    logger.info(f"Requirements installation completed in {total_duration:.1f}s")
     logger.info(f"Failed packages: {len(failed_packages)}")
 
     if failed_packages:
@@ -535,34 +867,46 @@ def install_requirements() -> bool:
         print_colored("🔧 Try installing failed packages manually:", Colors.YELLOW, "warning")
         print_colored(f"   pip install {' '.join(failed_packages[:5])}{'...' if len(failed_packages) > 5 else ''}", Colors.WHITE)
         return False
+    elif not to_install:
+        logger.info(f"All {total_packages + 1} packages already up to date ({total_duration:.1f}s)")
+        print_colored(f"✅ All {total_packages + 1} packages already up to date ({total_duration:.1f}s)", Colors.GREEN_BOLD)
+        return True
     else:
-        logger.info(f"ALL {total_packages + 1} packages installed successfully in {total_duration.total_seconds():.1f}s")
-        print_colored(f"✅ ALL {total_packages + 1} packages installed successfully! ({total_duration.total_seconds():.1f}s)", Colors.GREEN + Colors.BOLD)
+        skipped = total_packages + 1 - len(to_install)
+        logger.info(f"{len(to_install)} packages installed, {skipped} already up to date, in {total_duration:.1f}s")
+        print_colored(f"✅ {len(to_install)} packages installed successfully, {skipped} already up to date! ({total_duration:.1f}s)", Colors.GREEN_BOLD)
         return True
 
-def create_env_file() -> bool:
+def write_new_file(path: Path, data: bytes) -> bool:
+    """Atomically create a file with the given content; returns False if it already exists"""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o644)
+    except FileExistsError:
+        return False
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return True
+
+def create_env_file(root_entries: Set[str]) -> bool:
     """Create comprehensive .env file with all supported providers"""
     logger.info("Starting environment file creation")
     env_example = Path(".env.example")
     env_file = Path(".env")
 
-    logger.info(f"Checking for .env.example: {env_example.exists()}")
-    logger.info(f"Checking for .env: {env_file.exists()}")
     print_colored("⚙️  Setting up environment configuration...", Colors.BLUE)
 
+    if ".env" in root_entries:
+        logger.info(".env file already exists")
+        print_colored("✅ .env file already exists", Colors.GREEN)
+        return True
+
     try:
-        if env_example.exists() and not env_file.exists():
-            logger.info("Creating .env file from .env.example template")
-            shutil.copy(env_example, env_file)
-            logger.info("Successfully created .env file from template")
-            print_colored("✅ Created .env file from template", Colors.GREEN)
-            print_colored("   📝 Please edit .env file to add your API keys", Colors.YELLOW, "warning")
-        elif env_file.exists():
-            logger.info(".env file already exists")
-            print_colored("✅ .env file already exists", Colors.GREEN)
+        if ".env.example" in root_entries:
+            content = env_example.read_bytes()
+            from_template = True
         else:
-            logger.info("Creating .env file with default content")
-            env_content = """# CloneMe Environment Configuration
+            from_template = False
+            content = """# CloneMe Environment Configuration
 # Copy from .env.example and fill in your actual values
 
 # Platform Configuration (optional - defaults to discord)
@@ -589,11 +933,18 @@ AI_MODEL=gpt-4
 # This should match the JSON filename (without .json extension), not a key inside the file
 # For example, if you have profiles/my_profile.json, use AI_PROFILE=my_profile
 AI_PROFILE=default_profile
-"""
-
-            with open(env_file, 'w', encoding='utf-8') as f:
-                f.write(env_content)
+""".encode('utf-8')
 
+        created = write_new_file(env_file, content)
+        root_entries.add(".env")
+        if not created:
+            logger.info(".env file already exists")
+            print_colored("✅ .env file already exists", Colors.GREEN)
+        elif from_template:
+            logger.info("Successfully created .env file from .env.example template")
+            print_colored("✅ Created .env file from template", Colors.GREEN)
+            print_colored("   📝 Please edit .env file to add your API keys", Colors.YELLOW, "warning")
+        else:
             logger.info("Successfully created .env file with default content")
             print_colored("✅ Created comprehensive .env file", Colors.GREEN)
             print_colored("   📝 Please edit .env file to add your API keys", Colors.YELLOW, "warning")
@@ -615,7 +966,7 @@ AI_PROFILE=default_profile
         print_colored(f"❌ Unexpected error creating .env file: {e}", Colors.RED, "error")
         return False
 
-def setup_profile() -> None:
+def setup_profile(profile_entries: Set[str]) -> None:
     """Set up user profile with comprehensive templates"""
     profile_dir = Path("profiles")
     user_profile = profile_dir / "my_profile.json"
@@ -624,14 +975,23 @@ def setup_profile() -> None:
 
     print_colored("🎭 Setting up user profiles...", Colors.BLUE)
 
-    if not default_template.exists():
+    if default_template.name not in profile_entries:
         create_default_profile_template(default_template)
+        profile_entries.add(default_template.name)
+
+    if user_profile.name in profile_entries:
+        template = None
+    else:
+        try:
+            template = default_template.read_bytes()
+        except OSError:
+            template = None
 
-    if not user_profile.exists() and default_template.exists():
-        shutil.copy(default_template, user_profile)
+    if template is not None and write_new_file(user_profile, template):
+        profile_entries.add(user_profile.name)
         print_colored("✅ Created your profile from template", Colors.GREEN)
         print_colored("   📝 Edit profiles/my_profile.json to customize your personality", Colors.YELLOW)
-    elif user_profile.exists():
+    elif template is not None or user_profile.name in profile_entries:
         print_colored("✅ User profile already exists", Colors.GREEN)
     else:
         print_colored("⚠️  Warning: No profile template found", Colors.YELLOW)
@@ -639,70 +999,80 @@ def setup_profile() -> None:
 
     create_example_profiles(examples_dir)
 
-def create_default_profile_template(template_path: Path) -> None:
-    """Create a comprehensive default profile template matching actual CloneMe schema"""
-    profile_template = {
-        "profiles": {
-            "default": {
-                "required": {
-                    "username": "Your Username",
-                    "name": "Your Full Name"
-                },
-                "basic_info": {
-                    "Name": "Your Full Name",
-                    "Age": "25",
-                    "Gender": "your_gender",
-                    "Occupation": "Your Occupation",
-                    "Interests": "Your interests and hobbies",
-                    "Location": "Your location",
-                    "Education": "Your education background",
-                    "Languages": ["English"],
-                    "Hobbies": ["hobby1", "hobby2"],
-                    "Goals": "Your personal or professional goals"
-                },
-                "personality_traits": {
-                    "Introversion/Extroversion": "Describe your social energy preferences",
-                    "Sense of Humor": "Describe your humor style",
-                    "Communication Style": "How you prefer to communicate",
-                    "Mood": "Your general mood and attitude",
-                    "Formality Level": "Your preferred level of formality",
-                    "Core Values": ["value1", "value2", "value3"],
-                    "Decision Making": "How you make decisions",
-                    "Conflict Resolution": "How you handle conflicts"
+# Default profile matching the actual CloneMe schema
+PROFILE_TEMPLATE = {
+    "profiles": {
+        "default": {
+            "required": {
+                "username": "Your Username",
+                "name": "Your Full Name"
+            },
+            "basic_info": {
+                "Name": "Your Full Name",
+                "Age": "25",
+                "Gender": "your_gender",
+                "Occupation": "Your Occupation",
+                "Interests": "Your interests and hobbies",
+                "Location": "Your location",
+                "Education": "Your education background",
+                "Languages": ["English"],
+                "Hobbies": ["hobby1", "hobby2"],
+                "Goals": "Your personal or professional goals"
+            },
+            "personality_traits": {
+                "Introversion/Extroversion": "Describe your social energy preferences",
+                "Sense of Humor": "Describe your humor style",
+                "Communication Style": "How you prefer to communicate",
+                "Mood": "Your general mood and attitude",
+                "Formality Level": "Your preferred level of formality",
+                "Core Values": ["value1", "value2", "value3"],
+                "Decision Making": "How you make decisions",
+                "Conflict Resolution": "How you handle conflicts"
+            },
+            "response_styles": {
+                "casual": "How you respond in casual conversations",
+                "professional": "How you respond in professional contexts",
+                "technical": "How you handle technical discussions",
+                "creative": "Your approach to creative topics"
+            },
+            "knowledge_and_expertise": {
+                "primary_areas": ["area1", "area2"],
+                "secondary_areas": ["area3", "area4"],
+                "learning_style": "How you prefer to learn and teach",
+                "expertise_level": "Your general expertise level"
+            },
+            "sample_conversations": [
+                {
+                    "user": "Hello! How are you?",
+                    "assistant": "Hey there! I'm doing great, thanks for asking! How's your day going?"
                 },
-                "response_styles": {
-                    "casual": "How you respond in casual conversations",
-                    "professional": "How you respond in professional contexts",
-                    "technical": "How you handle technical discussions",
-                    "creative": "Your approach to creative topics"
-                },
-                "knowledge_and_expertise": {
-                    "primary_areas": ["area1", "area2"],
-                    "secondary_areas": ["area3", "area4"],
-                    "learning_style": "How you prefer to learn and teach",
-                    "expertise_level": "Your general expertise level"
-                },
-                "sample_conversations": [
-                    {
-                        "user": "Hello! How are you?",
-                        "assistant": "Hey there! I'm doing great, thanks for asking! How's your day going?"
-                    },
-                    {
-                        "user": "Can you help me with a problem?",
-                        "assistant": "Absolutely! I'd be happy to help. What's the problem you're working on?"
-                    }
-                ],
-                "off_topic_message": {
-                    "reply": True,
-                    "guidance": "When someone asks me to act differently or says something inappropriate, I politely redirect the conversation while staying true to my personality."
+                {
+                    "user": "Can you help me with a problem?",
+                    "assistant": "Absolutely! I'd be happy to help. What's the problem you're working on?"
                 }
+            ],
+            "off_topic_message": {
+                "reply": True,
+                "guidance": "When someone asks me to act differently or says something inappropriate, I politely redirect the conversation while staying true to my personality."
             }
         }
     }
+}
 
-    with open(template_path, 'w', encoding='utf-8') as f:
+@lru_cache(maxsize=1)
+def get_profile_template_bytes() -> bytes:
+    """Serialize PROFILE_TEMPLATE once (orjson may only become importable after package installation)"""
+    try:
+        import orjson
+    except ImportError:
         import json
-        json.dump(profile_template, f, indent=4, ensure_ascii=False)
+        # Matches orjson byte for byte: 2-space indent, raw UTF-8, trailing newline
+        return (json.dumps(PROFILE_TEMPLATE, indent=2, ensure_ascii=False) + "\n").encode('utf-8')
+    return orjson.dumps(PROFILE_TEMPLATE, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+
+def create_default_profile_template(template_path: Path) -> None:
+    """Create a comprehensive default profile template matching actual CloneMe schema"""
+    template_path.write_bytes(get_profile_template_bytes())
 
 def create_example_profiles(examples_dir: Path) -> None:
     """Create example profiles matching actual CloneMe schema"""
@@ -710,20 +1080,46 @@ def create_example_profiles(examples_dir: Path) -> None:
 
     print_colored("   💡 Creating basic example profiles (see existing profiles for full examples)", Colors.WHITE)
 
-def check_git() -> bool:
+def scan_directory(path: str) -> Set[str]:
+    """List the entry names of a directory in one scandir pass (empty if it does not exist)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries}
+    except (FileNotFoundError, NotADirectoryError):
+        return set()
+
+@lru_cache(maxsize=1)
+def find_git() -> Optional[str]:
+    """Locate the git executable on PATH (looked up at most once per process)"""
+    import shutil
+    return shutil.which("git")
+
+def has_uncommitted_changes(git_bin: str) -> bool:
+    """Run `git status --porcelain` and report whether the working tree has changes"""
+    result = subprocess.run([git_bin, "status", "--porcelain"],
+                          capture_output=True, text=True, check=True)
+    return bool(result.stdout.strip())
+
+def check_git(root_entries: Set[str]) -> bool:
     """Check git repository status and provide recommendations"""
-    git_dir = Path(".git")
-
-    if git_dir.exists():
+    if ".git" in root_entries:
         print_colored("✅ Git repository detected", Colors.GREEN)
 
+        # The uncommitted-changes hint costs a git process, so it is opt-in
+        if os.environ.get("CLONEME_SETUP_GIT_CHECK") != "1":
+            logger.debug("Skipping git status check (set CLONEME_SETUP_GIT_CHECK=1 to enable)")
+            return True
+
+        git_bin = find_git()
+        if git_bin is None:
+            logger.debug("git executable not found on PATH, skipping git status check")
+            return True
+
         try:
-            result = subprocess.run(["git", "status", "--porcelain"],
-                                  capture_output=True, text=True, check=True)
-            if result.stdout.strip():
+            if has_uncommitted_changes(git_bin):
                 print_colored("   ⚠️  You have uncommitted changes", Colors.YELLOW)
                 print_colored("   💡 Consider committing changes after setup", Colors.WHITE)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        except subprocess.CalledProcessError:
             pass
 
         return True
@@ -733,7 +1129,26 @@ def check_git() -> bool:
         print_colored("   git init && git add . && git commit -m 'Initial commit'", Colors.WHITE)
         return False
 
-def verify_installation() -> bool:
+# Install name -> import name for the packages the bot cannot start without
+CRITICAL_PACKAGES = {
+    "langchain": "langchain",
+    "anthropic": "anthropic",
+    "openai": "openai",
+    "python-dotenv": "dotenv",
+}
+
+def find_missing_modules() -> List[str]:
+    """Return the install names of the critical packages whose modules cannot be found"""
+    from concurrent.futures import ThreadPoolExecutor
+    from importlib.util import find_spec
+
+    # find_spec only locates each package, without executing its (heavy) __init__; the
+    # sys.path lookups are independent, so run them concurrently
+    with ThreadPoolExecutor(max_workers=len(CRITICAL_PACKAGES)) as executor:
+        specs = list(executor.map(find_spec, CRITICAL_PACKAGES.values()))
+    return [package for package, spec in zip(CRITICAL_PACKAGES, specs) if spec is None]
+
+def verify_installation(root_entries: Set[str], profile_entries: Set[str]) -> bool:
     """Verify that the installation was successful"""
     print_colored("🔍 Verifying installation...", Colors.BLUE)
     
@@ -742,14 +1157,11 @@ def verify_installation() -> bool:
         "main.py"
     ]
 
-    profile_files = list(Path("profiles").glob("*.json")) if Path("profiles").exists() else []
-
-    missing_files = []
-    for file_path in critical_files:
-        if not Path(file_path).exists():
-            missing_files.append(file_path)
+    # All critical files live in the project root, so one directory scan answers every check
+    missing_files = [file_path for file_path in critical_files if file_path not in root_entries]
 
-    if not profile_files:
+    # Names come from the shared scan; only a matching name costs a stat, and the first real file ends the check
+    if not any(name.endswith(".json") and os.path.isfile(os.path.join("profiles", name)) for name in profile_entries):
         missing_files.append("profiles/*.json (no profile files found)")
 
     if missing_files:
@@ -759,14 +1171,7 @@ def verify_installation() -> bool:
             print_colored(f"   - {file}", Colors.RED)
         return False
 
-    critical_modules = ["langchain", "anthropic", "openai", "dotenv"]
-    failed_imports = []
-
-    for module_name in critical_modules:
-        try:
-            __import__(module_name)
-        except ImportError:
-            failed_imports.append(module_name)
+    failed_imports = find_missing_modules()
 
     if failed_imports:
         print_colored(f"❌ Module import failed: {', '.join(failed_imports)}", Colors.RED)
@@ -777,61 +1182,97 @@ def verify_installation() -> bool:
     print_colored("✅ Installation verification successful!", Colors.GREEN)
     return True
 
+# (title color, title, tip lines) for each section of the final instructions
+NEXT_STEPS_SECTIONS = (
+    (Colors.YELLOW, "1. 🔑 Configure API Keys:", (
+        "   Edit .env file and add your AI provider API keys",
+        "   (You only need keys for providers you plan to use)"
+    )),
+    (Colors.YELLOW, "2. 🎭 Customize Your Profile:", (
+        "   Edit profiles/default_profile.json to match your personality",
+        "   Or create a new profile file and set AI_PROFILE to the filename (without .json)",
+        "   Check existing profiles/ for examples of the correct format"
+    )),
+    (Colors.YELLOW, "3. 🚀 Launch CloneMe:", (
+        "   python main.py" if IS_WINDOWS else "   python3 main.py",
+    )),
+    (Colors.BOLD, "📚 HELPFUL RESOURCES:", (
+        "• 📖 Documentation: Check README.md for detailed usage",
+        "• 🎭 Profile Examples: Check existing profiles/ for correct format",
+        "• 🔧 Configuration: .env file for all settings",
+        "• 📝 Logs: logs/ directory for troubleshooting"
+    )),
+    (Colors.BOLD, "💡 PRO TIPS:", (
+        "• Start with OpenAI (gpt-4) or Anthropic (claude-3-sonnet) for best results",
+        "• AI_PROFILE should match the JSON filename (without .json extension)",
+        "• Test with simple conversations first",
+        "• Check logs/ if you encounter any issues",
+        "• Memory system learns from your conversations"
+    )),
+    (Colors.BOLD, "🆘 NEED HELP?", (
+        "• Check the logs in logs/ directory",
+        "• Verify your API keys in .env file",
+        "• Ensure you're using Python 3.11.6"
+    ))
+)
+
 def print_next_steps() -> None:
     """Print comprehensive next steps and usage instructions"""
-    print()
-    print_colored("=" * 80, Colors.CYAN)
-    print_colored("🎉 SETUP COMPLETE - CloneMe is Ready!", Colors.GREEN + Colors.BOLD)
-    print_colored("=" * 80, Colors.CYAN)
-    print()
+    lines = [
+        ("", ""),
+        (Colors.CYAN, "=" * 80),
+        (Colors.GREEN_BOLD, "🎉 SETUP COMPLETE - CloneMe is Ready!"),
+        (Colors.CYAN, "=" * 80),
+        ("", ""),
+        (Colors.BOLD, "📋 IMMEDIATE NEXT STEPS:")
+    ]
 
-    print_colored("📋 IMMEDIATE NEXT STEPS:", Colors.BOLD)
-    print_colored("1. 🔑 Configure API Keys:", Colors.YELLOW)
-    print_colored("   Edit .env file and add your AI provider API keys", Colors.WHITE)
-    print_colored("   (You only need keys for providers you plan to use)", Colors.WHITE)
-    print()
+    for title_color, title, tips in NEXT_STEPS_SECTIONS:
+        lines.append((title_color, title))
+        lines.extend((Colors.WHITE, tip) for tip in tips)
+        lines.append(("", ""))
 
-    print_colored("2. 🎭 Customize Your Profile:", Colors.YELLOW)
-    print_colored("   Edit profiles/default_profile.json to match your personality", Colors.WHITE)
-    print_colored("   Or create a new profile file and set AI_PROFILE to the filename (without .json)", Colors.WHITE)
-    print_colored("   Check existing profiles/ for examples of the correct format", Colors.WHITE)
-    print()
+    lines.extend((
+        (Colors.CYAN, "=" * 80),
+        (Colors.MAGENTA_BOLD, "Happy cloning! 🤖✨"),
+        (Colors.CYAN, "=" * 80)
+    ))
+    print_block(lines)
 
-    print_colored("3. 🚀 Launch CloneMe:", Colors.YELLOW)
-    if platform.system() == "Windows":
-        print_colored("   python main.py", Colors.WHITE)
-    else:
-        print_colored("   python3 main.py", Colors.WHITE)
-    print()
+# Anchored to the project root (the script's parent directory), independent of the working directory
+SETUP_FINGERPRINT_FILE = SCRIPT_PATH.parent.parent / "logs" / "setup" / ".setup_ok"
 
-    print_colored("📚 HELPFUL RESOURCES:", Colors.BOLD)
-    print_colored("• 📖 Documentation: Check README.md for detailed usage", Colors.WHITE)
-    print_colored("• 🎭 Profile Examples: Check existing profiles/ for correct format", Colors.WHITE)
-    print_colored("• 🔧 Configuration: .env file for all settings", Colors.WHITE)
-    print_colored("• 📝 Logs: logs/ directory for troubleshooting", Colors.WHITE)
-    print()
+def compute_setup_fingerprint() -> str:
+    """Hash the setup inputs (this script, the lock file, requirements.txt, .env.example) and the target environment"""
+    import hashlib
 
-    print_colored("💡 PRO TIPS:", Colors.BOLD)
-    print_colored("• Start with OpenAI (gpt-4) or Anthropic (claude-3-sonnet) for best results", Colors.WHITE)
-    print_colored("• AI_PROFILE should match the JSON filename (without .json extension)", Colors.WHITE)
-    print_colored("• Test with simple conversations first", Colors.WHITE)
-    print_colored("• Check logs/ if you encounter any issues", Colors.WHITE)
-    print_colored("• Memory system learns from your conversations", Colors.WHITE)
-    print()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(sys.prefix.encode('utf-8'))
+    for path in (SCRIPT_PATH, REQUIREMENTS_LOCK_FILE, Path("requirements.txt"), Path(".env.example")):
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"missing:" + str(path).encode('utf-8'))
+    return digest.hexdigest()
 
-    print_colored("🆘 NEED HELP?", Colors.BOLD)
-    print_colored("• Check the logs in logs/ directory", Colors.WHITE)
-    print_colored("• Verify your API keys in .env file", Colors.WHITE)
-    print_colored("• Ensure you're using Python 3.11.6", Colors.WHITE)
-    print()
+def is_setup_unchanged(fingerprint: str) -> bool:
+    """Check whether packages were installed successfully with the same setup inputs before"""
+    try:
+        return SETUP_FINGERPRINT_FILE.read_text(encoding='utf-8').strip() == fingerprint
+    except OSError:
+        return False
 
-    print_colored("=" * 80, Colors.CYAN)
-    print_colored("Happy cloning! 🤖✨", Colors.MAGENTA + Colors.BOLD)
-    print_colored("=" * 80, Colors.CYAN)
+def save_setup_fingerprint(fingerprint: str) -> None:
+    """Record a successful package installation for the given setup inputs"""
+    try:
+        SETUP_FINGERPRINT_FILE.parent.mkdir(parents=True, exist_ok=True)
+        SETUP_FINGERPRINT_FILE.write_text(fingerprint, encoding='utf-8')
+    except OSError as e:
+        logger.warning(f"Could not write setup fingerprint {SETUP_FINGERPRINT_FILE}: {e}")
 
 def main() -> None:
     """Main setup function with comprehensive error handling"""
-    setup_start_time = datetime.now()
+    setup_start_ns = time.perf_counter_ns()
     logger.info("=" * 60)
     logger.info("MAIN SETUP FUNCTION STARTED")
     logger.info("=" * 60)
@@ -865,83 +1306,101 @@ def main() -> None:
             sys.exit(1)
 
         logger.info("Phase 4: Package installation")
-        print_colored("📦 PACKAGE INSTALLATION PHASE", Colors.BLUE + Colors.BOLD)
+        print_colored("📦 PACKAGE INSTALLATION PHASE", Colors.BLUE_BOLD)
         print_colored("This may take several minutes depending on your internet connection...", Colors.WHITE)
         print()
 
-        if not install_requirements():
+        fingerprint = compute_setup_fingerprint()
+        if is_setup_unchanged(fingerprint) and not find_missing_modules():
+            logger.info("Setup inputs unchanged since last successful install, skipping install phase")
+            print_colored("✅ Packages unchanged since the last successful setup, skipping installation", Colors.GREEN)
+        elif install_requirements():
+            save_setup_fingerprint(fingerprint)
+        else:
             logger.error("Setup failed during package installation")
-            print_colored("❌ Setup failed during package installation", Colors.RED + Colors.BOLD, "error")
-            print_colored("🔧 Troubleshooting tips:", Colors.YELLOW, "warning")
-            print_colored("   • Check your internet connection", Colors.WHITE)
-            print_colored("   • Try running: pip install --upgrade pip", Colors.WHITE)
-            print_colored("   • Ensure you have sufficient disk space", Colors.WHITE)
-            print_colored("   • Try running setup again", Colors.WHITE)
-            print_colored(f"   • Check setup logs: logs/setup/", Colors.WHITE)
+            print_block([
+                (Colors.RED_BOLD, "❌ Setup failed during package installation", "error"),
+                (Colors.YELLOW, "🔧 Troubleshooting tips:", "warning"),
+                (Colors.WHITE, "   • Check your internet connection"),
+                (Colors.WHITE, "   • Try running: pip install --upgrade pip"),
+                (Colors.WHITE, "   • Ensure you have sufficient disk space"),
+                (Colors.WHITE, "   • Try running setup again"),
+                (Colors.WHITE, "   • Check setup logs: logs/setup/"),
+            ])
             sys.exit(1)
 
         print()
 
+        # One scan of each directory serves every later phase; files created below are added to the sets
+        root_entries = scan_directory(".")
+        profile_entries = scan_directory("profiles")
+
         logger.info("Phase 5: Configuration setup")
-        print_colored("⚙️  CONFIGURATION PHASE", Colors.BLUE + Colors.BOLD)
-        if not create_env_file():
+        print_colored("⚙️  CONFIGURATION PHASE", Colors.BLUE_BOLD)
+        if not create_env_file(root_entries):
             logger.warning("Environment file creation failed")
             print_colored("⚠️  Warning: Environment file creation failed", Colors.YELLOW, "warning")
 
-        setup_profile()
+        setup_profile(profile_entries)
         print()
 
         logger.info("Phase 6: Git repository check")
-        check_git()
+        check_git(root_entries)
         print()
 
         logger.info("Phase 7: Installation verification")
-        if not verify_installation():
+        if not verify_installation(root_entries, profile_entries):
             logger.warning("Setup completed with warnings")
             print_colored("❌ Setup completed with warnings", Colors.YELLOW, "warning")
             print_colored("   Some components may not work correctly", Colors.YELLOW, "warning")
         else:
             logger.info("Setup completed successfully")
-            print_colored("✅ Setup completed successfully!", Colors.GREEN + Colors.BOLD)
+            print_colored("✅ Setup completed successfully!", Colors.GREEN_BOLD)
 
-        total_setup_time = datetime.now() - setup_start_time
-        logger.info(f"Total setup time: {total_setup_time.total_seconds():.1f} seconds")
+        total_setup_seconds = (time.perf_counter_ns() - setup_start_ns) / 1e9
+        logger.info(f"Total setup time: {total_setup_seconds:.1f} seconds")
 
         logger.info("Phase 8: Displaying next steps")
         print_next_steps()
 
-        print_colored("📋 SETUP LOGS:", Colors.BOLD)
-        print_colored(f"• 📝 Detailed logs saved to: logs/setup/", Colors.WHITE)
-        print_colored("• 🔍 Check logs if you encounter any issues", Colors.WHITE)
-        print()
+        print_block([
+            (Colors.BOLD, "📋 SETUP LOGS:"),
+            (Colors.WHITE, "• 📝 Detailed logs saved to: logs/setup/"),
+            (Colors.WHITE, "• 🔍 Check logs if you encounter any issues"),
+            ("", ""),
+        ])
 
         logger.info("=" * 60)
         logger.info("SETUP COMPLETED SUCCESSFULLY")
-        logger.info(f"Total execution time: {total_setup_time.total_seconds():.1f} seconds")
+        logger.info(f"Total execution time: {total_setup_seconds:.1f} seconds")
         logger.info("=" * 60)
 
     except KeyboardInterrupt:
         logger.warning("Setup cancelled by user (KeyboardInterrupt)")
-        print()
-        print_colored("❌ Setup cancelled by user", Colors.YELLOW, "warning")
-        print_colored("   Run the setup script again to complete installation", Colors.WHITE)
-        print_colored(f"   Setup logs saved to: logs/setup/", Colors.WHITE)
+        print_block([
+            ("", ""),
+            (Colors.YELLOW, "❌ Setup cancelled by user", "warning"),
+            (Colors.WHITE, "   Run the setup script again to complete installation"),
+            (Colors.WHITE, "   Setup logs saved to: logs/setup/"),
+        ])
         sys.exit(1)
 
     except Exception as e:
         logger.error(f"CRITICAL ERROR: Setup failed unexpectedly: {e}", exc_info=True)
-        print()
-        print_colored("❌ CRITICAL ERROR: Setup failed unexpectedly", Colors.RED + Colors.BOLD, "error")
-        print_colored(f"   Error details: {str(e)}", Colors.RED, "error")
-        print()
-        print_colored("🔧 Troubleshooting:", Colors.YELLOW, "warning")
-        print_colored("   • Check your Python installation", Colors.WHITE)
-        print_colored("   • Ensure you have internet connectivity", Colors.WHITE)
-        print_colored("   • Try running as administrator (Windows) or with sudo (Linux)", Colors.WHITE)
-        print_colored("   • Check available disk space", Colors.WHITE)
-        print_colored(f"   • Check detailed logs in: logs/setup/", Colors.WHITE)
-        print()
-        print_colored("📧 If the problem persists, please report this error with the log file", Colors.WHITE)
+        print_block([
+            ("", ""),
+            (Colors.RED_BOLD, "❌ CRITICAL ERROR: Setup failed unexpectedly", "error"),
+            (Colors.RED, f"   Error details: {str(e)}", "error"),
+            ("", ""),
+            (Colors.YELLOW, "🔧 Troubleshooting:", "warning"),
+            (Colors.WHITE, "   • Check your Python installation"),
+            (Colors.WHITE, "   • Ensure you have internet connectivity"),
+            (Colors.WHITE, "   • Try running as administrator (Windows) or with sudo (Linux)"),
+            (Colors.WHITE, "   • Check available disk space"),
+            (Colors.WHITE, "   • Check detailed logs in: logs/setup/"),
+            ("", ""),
+            (Colors.WHITE, "📧 If the problem persists, please report this error with the log file")
+        ])
 
         logger.error("=" * 60)
         logger.error("SETUP FAILED WITH CRITICAL ERROR")
@@ -950,6 +1409,8 @@ def main() -> None:
         sys.exit(1)
 
 if __name__ == "__main__":
+    enable_windows_ansi()
+
     script_dir = Path(__file__).parent
     project_root = script_dir.parent
 